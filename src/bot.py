@@ -6,6 +6,7 @@ from discord.ext import commands
 from discord.ui import Button, View
 import os
 import logging
+import time
 from typing import Optional
 from dotenv import load_dotenv
 import asyncio
@@ -17,8 +18,8 @@ from .openrouter_client import OpenRouterClient
 from .utils import (
     identify_required_strikes,
     identify_required_strikes_by_date,
-    align_data_by_timestamp,
-    align_historic_data,
+    align_data_by_timestamp_arrays,
+    align_historic_data_arrays,
     align_constant_dte_premium_data,
     get_trading_dates,
     collect_earnings_iv_data
@@ -36,6 +37,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Streaming AI responses: minimum seconds between Discord message edits (Discord
+# rate-limits edits), and max preview length (message content is capped at 2000 chars)
+STREAM_EDIT_INTERVAL = 1.0
+STREAM_PREVIEW_CHARS = 1900
+
 
 class ChartControlView(View):
     """View with buttons for chart refresh and delete."""
@@ -135,7 +141,7 @@ class ChartControlView(View):
                 results = await asyncio.gather(*tasks)
 
                 historic_iv_by_strike = {strike: records for strike, records in results}
-                aligned_data = align_historic_data(ohlc_data, historic_iv_by_strike)
+                aligned_data = align_historic_data_arrays(ohlc_data, historic_iv_by_strike)
             else:
                 iv_data_by_strike = {}
 
@@ -163,9 +169,9 @@ class ChartControlView(View):
                         iv_data_by_strike[strike] = []
                     iv_data_by_strike[strike].extend(intraday_data)
 
-                aligned_data = align_data_by_timestamp(ohlc_data, iv_data_by_strike)
+                aligned_data = align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike)
 
-            if not aligned_data:
+            if len(aligned_data["timestamp"]) == 0:
                 await interaction.followup.send("❌ Could not align data for new expiration", ephemeral=True)
                 return
 
@@ -183,7 +189,7 @@ class ChartControlView(View):
                             try:
                                 ts = dt.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                                 ohlc_timestamps.append(ts)
-                            except:
+                            except (ValueError, TypeError):
                                 continue
 
                     if ohlc_timestamps:
@@ -197,7 +203,7 @@ class ChartControlView(View):
                                     report_date = dt.strptime(report_date_str, "%Y-%m-%d")
                                     if chart_start <= report_date <= chart_end:
                                         earnings_dates.append(report_date_str)
-                                except:
+                                except (ValueError, TypeError):
                                     continue
             except Exception as e:
                 logger.warning(f"Could not fetch earnings data: {e}")
@@ -297,7 +303,7 @@ class ChartControlView(View):
                 results = await asyncio.gather(*tasks)
 
                 historic_iv_by_strike = {strike: records for strike, records in results}
-                aligned_data = align_historic_data(ohlc_data, historic_iv_by_strike)
+                aligned_data = align_historic_data_arrays(ohlc_data, historic_iv_by_strike)
             else:
                 iv_data_by_strike = {}
 
@@ -325,9 +331,9 @@ class ChartControlView(View):
                         iv_data_by_strike[strike] = []
                     iv_data_by_strike[strike].extend(intraday_data)
 
-                aligned_data = align_data_by_timestamp(ohlc_data, iv_data_by_strike)
+                aligned_data = align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike)
 
-            if not aligned_data:
+            if len(aligned_data["timestamp"]) == 0:
                 await interaction.followup.send(f"❌ Could not align data for {new_option_type}", ephemeral=True)
                 return
 
@@ -345,7 +351,7 @@ class ChartControlView(View):
                             try:
                                 ts = dt.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                                 ohlc_timestamps.append(ts)
-                            except:
+                            except (ValueError, TypeError):
                                 continue
 
                     if ohlc_timestamps:
@@ -359,7 +365,7 @@ class ChartControlView(View):
                                     report_date = dt.strptime(report_date_str, "%Y-%m-%d")
                                     if chart_start <= report_date <= chart_end:
                                         earnings_dates.append(report_date_str)
-                                except:
+                                except (ValueError, TypeError):
                                     continue
             except Exception as e:
                 logger.warning(f"Could not fetch earnings data: {e}")
@@ -486,7 +492,7 @@ class ChartControlView(View):
                 results = await asyncio.gather(*tasks)
 
                 historic_iv_by_strike = {strike: records for strike, records in results}
-                aligned_data = align_historic_data(ohlc_data, historic_iv_by_strike)
+                aligned_data = align_historic_data_arrays(ohlc_data, historic_iv_by_strike)
             else:
                 iv_data_by_strike = {}
 
@@ -514,9 +520,9 @@ class ChartControlView(View):
                         iv_data_by_strike[strike] = []
                     iv_data_by_strike[strike].extend(intraday_data)
 
-                aligned_data = align_data_by_timestamp(ohlc_data, iv_data_by_strike)
+                aligned_data = align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike)
 
-            if not aligned_data:
+            if len(aligned_data["timestamp"]) == 0:
                 await interaction.followup.send("❌ Could not align data for new expiration", ephemeral=True)
                 return
 
@@ -534,7 +540,7 @@ class ChartControlView(View):
                             try:
                                 ts = dt.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                                 ohlc_timestamps.append(ts)
-                            except:
+                            except (ValueError, TypeError):
                                 continue
 
                     if ohlc_timestamps:
@@ -548,7 +554,7 @@ class ChartControlView(View):
                                     report_date = dt.strptime(report_date_str, "%Y-%m-%d")
                                     if chart_start <= report_date <= chart_end:
                                         earnings_dates.append(report_date_str)
-                                except:
+                                except (ValueError, TypeError):
                                     continue
             except Exception as e:
                 logger.warning(f"Could not fetch earnings data: {e}")
@@ -656,7 +662,7 @@ class ChartControlView(View):
                 for strike, historic_records in results:
                     historic_iv_by_strike[strike] = historic_records
 
-                aligned_data = align_historic_data(ohlc_data, historic_iv_by_strike)
+                aligned_data = align_historic_data_arrays(ohlc_data, historic_iv_by_strike)
 
             else:
                 # INTRADAY MODE
@@ -692,9 +698,9 @@ class ChartControlView(View):
                         iv_data_by_strike[strike] = []
                     iv_data_by_strike[strike].extend(intraday_data)
 
-                aligned_data = align_data_by_timestamp(ohlc_data, iv_data_by_strike)
+                aligned_data = align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike)
 
-            if not aligned_data:
+            if len(aligned_data["timestamp"]) == 0:
                 await interaction.followup.send("❌ Could not refresh: Data alignment failed", ephemeral=True)
                 return
 
@@ -714,7 +720,7 @@ class ChartControlView(View):
                             try:
                                 ts = dt.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                                 ohlc_timestamps.append(ts)
-                            except:
+                            except (ValueError, TypeError):
                                 continue
 
                     if ohlc_timestamps:
@@ -731,7 +737,7 @@ class ChartControlView(View):
                                     # Only include earnings within actual chart range
                                     if chart_start <= report_date <= chart_end:
                                         earnings_dates.append(report_date_str)
-                                except:
+                                except (ValueError, TypeError):
                                     continue
 
                         if earnings_dates:
@@ -968,7 +974,22 @@ class IVBot(commands.Bot):
         if not api_key:
             raise ValueError("UNUSUAL_WHALES_API_KEY not found in environment")
 
-        self.uw_client = UnusualWhalesClient(api_key)
+        # Optional override of the client's concurrent request cap (positive integer)
+        max_concurrent_requests = None
+        max_concurrent_str = os.getenv("UNUSUAL_WHALES_MAX_CONCURRENT_REQUESTS", "").strip()
+        if max_concurrent_str:
+            try:
+                max_concurrent_requests = int(max_concurrent_str)
+            except ValueError:
+                pass
+            if max_concurrent_requests is None or max_concurrent_requests < 1:
+                logger.warning(
+                    f"Invalid UNUSUAL_WHALES_MAX_CONCURRENT_REQUESTS: {max_concurrent_str}, "
+                    f"using default of {UnusualWhalesClient.MAX_CONCURRENT_REQUESTS}"
+                )
+                max_concurrent_requests = None
+
+        self.uw_client = UnusualWhalesClient(api_key, max_concurrent_requests=max_concurrent_requests)
 
         # Initialize OpenRouter client
         openrouter_key = os.getenv("OPENROUTER_API_KEY")
@@ -1005,24 +1026,29 @@ class IVBot(commands.Bot):
         await self.tree.sync()
         logger.info("Command tree synced")
 
+    async def close(self):
+        """Release HTTP clients before shutting down the bot."""
+        if self.openrouter_client:
+            await self.openrouter_client.aclose()
+        await super().close()
+
     async def on_ready(self):
         """Called when bot is ready."""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
 
         # Register persistent views from database
         # This ensures buttons continue working after bot restarts
-        cursor = self.db.conn.execute("SELECT message_id, ticker, chart_type, expiration, dte, option_type, days, user_id FROM chart_messages")
-        rows = cursor.fetchall()
+        rows = self.db.get_all_charts()
 
         for row in rows:
-            message_id = row[0]
-            ticker = row[1]
-            chart_type = row[2]
-            expiration = row[3]
-            dte = row[4]
-            option_type = row[5]
-            days = row[6]
-            user_id = row[7]
+            message_id = row["message_id"]
+            ticker = row["ticker"]
+            chart_type = row["chart_type"]
+            expiration = row["expiration"]
+            dte = row["dte"]
+            option_type = row["option_type"]
+            days = row["days"]
+            user_id = row["user_id"]
 
             if chart_type == 'atm_premium':
                 # Register ATM premium view
@@ -1285,7 +1311,7 @@ async def iv_chart(
                 historic_iv_by_strike[strike] = historic_records
 
             # Align 4h OHLC with historic IV
-            aligned_data = align_historic_data(ohlc_data, historic_iv_by_strike)
+            aligned_data = align_historic_data_arrays(ohlc_data, historic_iv_by_strike)
 
         else:
             # INTRADAY MODE: Use existing intraday logic (unchanged)
@@ -1345,9 +1371,9 @@ async def iv_chart(
                 iv_data_by_strike[strike].extend(intraday_data)
 
             # Align intraday data
-            aligned_data = align_data_by_timestamp(ohlc_data, iv_data_by_strike)
+            aligned_data = align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike)
 
-        if not aligned_data:
+        if len(aligned_data["timestamp"]) == 0:
             await interaction.edit_original_response(
                 content="❌ Could not align price and IV data"
             )
@@ -1369,7 +1395,7 @@ async def iv_chart(
                         try:
                             ts = dt.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                             ohlc_timestamps.append(ts)
-                        except:
+                        except (ValueError, TypeError):
                             continue
 
                 if ohlc_timestamps:
@@ -1386,7 +1412,7 @@ async def iv_chart(
                                 # Only include earnings within actual chart range
                                 if chart_start <= report_date <= chart_end:
                                     earnings_dates.append(report_date_str)
-                            except:
+                            except (ValueError, TypeError):
                                 continue
 
                     if earnings_dates:
@@ -1521,7 +1547,7 @@ async def earnings(
                 try:
                     move_pct = float(expected_move_perc) * 100
                     move_str = f"${expected_move} ({move_pct:.2f}%)"
-                except:
+                except (ValueError, TypeError):
                     move_str = f"${expected_move}"
 
             embed.add_field(
@@ -1560,7 +1586,7 @@ async def earnings(
                 try:
                     move_pct = float(post_move_1d) * 100
                     recent_info += f"\n**1D Post Move:** {move_pct:+.2f}%"
-                except:
+                except (ValueError, TypeError):
                     pass
 
             embed.add_field(
@@ -1749,11 +1775,25 @@ async def market_news(
             content=f"🤖 Analyzing {len(filtered_news)} headlines with Claude Haiku 4.5..."
         )
 
-        summary = await bot.openrouter_client.summarize_news(
+        # Stream the summary, showing partial text while the model is still writing
+        summary_parts = []
+        last_edit_time = time.monotonic()
+
+        async for chunk in bot.openrouter_client.summarize_news_stream(
             news_items=filtered_news,
             user_query=question,
             hours=hours
-        )
+        ):
+            summary_parts.append(chunk)
+
+            if time.monotonic() - last_edit_time >= STREAM_EDIT_INTERVAL:
+                partial_summary = "".join(summary_parts)
+                await interaction.edit_original_response(
+                    content=f"{partial_summary[:STREAM_PREVIEW_CHARS]} ▌"
+                )
+                last_edit_time = time.monotonic()
+
+        summary = "".join(summary_parts)
 
         # Count major news items
         major_count = sum(1 for item in filtered_news if item.get("is_major", False))
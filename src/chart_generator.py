@@ -5,7 +5,7 @@ import matplotlib.dates as mdates
 from matplotlib.patches import Rectangle
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Union
 import logging
 import io
 import pytz
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 def create_iv_chart(
-    data: List[Dict[str, Any]],
+    data: Union[List[Dict[str, Any]], Dict[str, Sequence[Any]]],
     ticker: str,
     expiration: str,
     option_type: str,
@@ -24,7 +24,8 @@ def create_iv_chart(
     """Create a dual-axis chart with OHLC candles and IV line.
 
     Args:
-        data: List of aligned data points with OHLC and IV
+        data: Aligned OHLC and IV data, either as a list of data points or as
+            parallel columns (see align_data_by_timestamp_arrays)
         ticker: Stock ticker symbol
         expiration: Option expiration date
         option_type: "call" or "put"
@@ -34,11 +35,11 @@ def create_iv_chart(
     Returns:
         BytesIO object containing the PNG chart
     """
-    if not data:
-        raise ValueError("No data to plot")
-
     # Convert to DataFrame
     df = pd.DataFrame(data)
+    if df.empty:
+        raise ValueError("No data to plot")
+
     df["timestamp"] = pd.to_datetime(df["timestamp"])
     df = df.sort_values("timestamp")
 
@@ -192,7 +193,7 @@ def create_iv_chart(
         for date_str in earnings_dates:
             try:
                 earnings_dt_list.append(dt.strptime(date_str, "%Y-%m-%d").date())
-            except:
+            except (ValueError, TypeError):
                 logger.warning(f"Could not parse earnings date: {date_str}")
 
         # Find x_index positions for earnings dates that fall within chart range
@@ -550,11 +551,11 @@ def create_atm_premium_chart(
     Returns:
         BytesIO object containing the PNG chart
     """
-    if not data:
-        raise ValueError("No data to plot")
-
     # Convert to DataFrame
     df = pd.DataFrame(data)
+    if df.empty:
+        raise ValueError("No data to plot")
+
     df["timestamp"] = pd.to_datetime(df["timestamp"])
     df = df.sort_values("timestamp")
 
@@ -1,7 +1,7 @@
 """Unusual Whales API client for fetching market data."""
 
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 import logging
 import asyncio
@@ -19,19 +19,31 @@ class UnusualWhalesClient:
     # Concurrency limit: maximum number of simultaneous requests
     MAX_CONCURRENT_REQUESTS = 8  # Increased from 4 to 8 for better throughput (monitor for 429 errors)
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrent_requests: Optional[int] = None):
         """Initialize the API client.
 
         Args:
             api_key: Unusual Whales API key
+            max_concurrent_requests: Maximum number of simultaneous requests
+                (defaults to MAX_CONCURRENT_REQUESTS). Raising it only helps until
+                the API starts answering with 429s; past that point retries make
+                every request slower.
+
+        Raises:
+            ValueError: If max_concurrent_requests is less than 1
         """
+        if max_concurrent_requests is None:
+            max_concurrent_requests = self.MAX_CONCURRENT_REQUESTS
+        elif max_concurrent_requests < 1:
+            raise ValueError(f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}")
+
         self.api_key = api_key
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json"
         }
         # Semaphore to limit concurrent requests
-        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
         # Sliding window rate limiter: track request timestamps
         self._request_times = []
         self._rate_limit_lock = asyncio.Lock()
@@ -180,7 +192,7 @@ class UnusualWhalesClient:
                         candle_time = datetime.strptime(date_str, "%Y-%m-%d")
                         if candle_time >= cutoff_time:
                             filtered_data.append(candle)
-                    except:
+                    except (ValueError, TypeError):
                         # If we can't parse, include it to be safe
                         filtered_data.append(candle)
                 else:
@@ -188,10 +200,10 @@ class UnusualWhalesClient:
                     timestamp_str = candle.get("start_time") or candle.get("timestamp")
                     if timestamp_str:
                         try:
-                            candle_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                            candle_time = datetime.fromisoformat(timestamp_str)
                             if candle_time >= cutoff_time:
                                 filtered_data.append(candle)
-                        except:
+                        except (ValueError, TypeError):
                             # If we can't parse, include it to be safe
                             filtered_data.append(candle)
 
@@ -283,6 +295,37 @@ class UnusualWhalesClient:
         logger.info(f"Fetched {len(historic_data)} historic records for {contract_id}")
         return historic_data
 
+    async def get_option_historic_batch(
+        self,
+        contract_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch historic EOD data for several option contracts.
+
+        The API has no multi-contract historic endpoint, so this fans out one
+        get_option_historic() request per contract, bounded by the client's
+        semaphore and rate limiter. Callers go through this single entry point
+        so a native batch endpoint can be swapped in here later.
+
+        Args:
+            contract_ids: Option contract symbols
+
+        Returns:
+            Dictionary mapping contract_id to its historic records; contracts
+            whose request failed are omitted
+        """
+        results = await asyncio.gather(
+            *(self.get_option_historic(contract_id) for contract_id in contract_ids),
+            return_exceptions=True
+        )
+
+        historic_by_contract = {}
+        for contract_id, result in zip(contract_ids, results):
+            if isinstance(result, BaseException):
+                logger.debug(f"Failed to fetch historic data for {contract_id}: {result}")
+                continue
+            historic_by_contract[contract_id] = result
+        return historic_by_contract
+
     def parse_option_symbol(self, option_symbol: str) -> Dict[str, Any]:
         """Parse an option symbol to extract components.
 
@@ -432,10 +475,9 @@ class UnusualWhalesClient:
                 - tags: List of tags
                 - meta: Additional metadata
         """
-        from datetime import datetime, timedelta
-
         url = f"{self.BASE_URL}/api/news/headlines"
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        # Compare in epoch seconds so the cutoff is timezone-independent
+        cutoff_epoch = time.time() - hours_back * 3600
 
         all_headlines = []
         page = 1
@@ -472,10 +514,12 @@ class UnusualWhalesClient:
 
             if created_at_str:
                 try:
-                    created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                    created_at = created_at.replace(tzinfo=None)
+                    # fromisoformat accepts a trailing 'Z' natively (Python 3.11+)
+                    created_at = datetime.fromisoformat(created_at_str)
+                    if created_at.tzinfo is None:
+                        created_at = created_at.replace(tzinfo=timezone.utc)
 
-                    if created_at < cutoff_time:
+                    if created_at.timestamp() < cutoff_epoch:
                         # Oldest item is outside our time window, stop fetching
                         logger.info(f"Reached news older than {hours_back} hours on page {page}, stopping pagination")
                         break
@@ -1,7 +1,9 @@
 """SQLite database for storing chart message metadata."""
 
 import sqlite3
-from typing import Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import datetime
 import logging
 
@@ -11,22 +13,63 @@ logger = logging.getLogger(__name__)
 class ChartDatabase:
     """Database for persisting chart message information."""
 
+    __slots__ = ("db_path", "_local", "_readers", "_writer", "_write_lock")
+
     def __init__(self, db_path: str = "data/charts.db"):
         """Initialize database connection and create tables.
 
+        Reads use one connection per thread; all writes go through a single
+        writer connection guarded by a lock and run in BEGIN IMMEDIATE
+        transactions, so a writer never upgrades a read lock mid-transaction
+        and hits SQLITE_BUSY. WAL mode lets readers proceed during writes.
+
         Args:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Allow dict-like access
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
         self.create_table()
         logger.info(f"Database initialized at {db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode (transactions are explicit)."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Allow dict-like access
+        return conn
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """Return the calling thread's read connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._write_lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block on the writer connection inside BEGIN IMMEDIATE ... COMMIT.
+
+        Rolls back and re-raises if the block fails.
+        """
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
     def create_table(self):
         """Create chart_messages table if it doesn't exist."""
-        with self.conn:
-            self.conn.execute("""
+        with self._write_transaction() as conn:
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS chart_messages (
                     message_id INTEGER PRIMARY KEY,
                     channel_id INTEGER NOT NULL,
@@ -42,37 +85,39 @@ class ChartDatabase:
             """)
 
             # Migrate existing table if needed
-            self._migrate_schema()
+            self._migrate_schema(conn)
 
-            logger.info("Chart messages table ready")
+        logger.info("Chart messages table ready")
 
-    def _migrate_schema(self):
-        """Migrate existing schema to support both IV charts and ATM premium charts."""
-        cursor = self.conn.execute("PRAGMA table_info(chart_messages)")
+    def _migrate_schema(self, conn: sqlite3.Connection):
+        """Migrate existing schema to support both IV charts and ATM premium charts.
+
+        Args:
+            conn: Writer connection with an open transaction
+        """
+        cursor = conn.execute("PRAGMA table_info(chart_messages)")
         columns = {row[1] for row in cursor.fetchall()}
 
         # Add chart_type column if missing
         if 'chart_type' not in columns:
             logger.info("Migrating schema: adding chart_type column")
-            self.conn.execute("""
+            conn.execute("""
                 ALTER TABLE chart_messages
                 ADD COLUMN chart_type TEXT DEFAULT 'iv_chart'
             """)
             # Set existing rows to 'iv_chart'
-            self.conn.execute("""
+            conn.execute("""
                 UPDATE chart_messages SET chart_type = 'iv_chart' WHERE chart_type IS NULL
             """)
 
         # Add dte column if missing
         if 'dte' not in columns:
             logger.info("Migrating schema: adding dte column")
-            self.conn.execute("""
+            conn.execute("""
                 ALTER TABLE chart_messages
                 ADD COLUMN dte INTEGER
             """)
 
-        self.conn.commit()
-
     def store_chart(
         self,
         message_id: int,
@@ -102,8 +147,8 @@ class ChartDatabase:
             True if successful
         """
         try:
-            with self.conn:
-                self.conn.execute("""
+            with self._write_transaction() as conn:
+                conn.execute("""
                     INSERT INTO chart_messages
                     (message_id, channel_id, user_id, ticker, chart_type, expiration, dte, option_type, days)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -124,7 +169,7 @@ class ChartDatabase:
         Returns:
             Dictionary with chart metadata, or None if not found
         """
-        cursor = self.conn.execute("""
+        cursor = self._read_conn().execute("""
             SELECT message_id, channel_id, user_id, ticker, chart_type, expiration, dte, option_type, days, created_at
             FROM chart_messages
             WHERE message_id = ?
@@ -135,6 +180,18 @@ class ChartDatabase:
             return dict(row)
         return None
 
+    def get_all_charts(self) -> List[Dict[str, Any]]:
+        """Retrieve metadata for every stored chart message.
+
+        Returns:
+            List of chart metadata dictionaries
+        """
+        cursor = self._read_conn().execute("""
+            SELECT message_id, ticker, chart_type, expiration, dte, option_type, days, user_id
+            FROM chart_messages
+        """)
+        return [dict(row) for row in cursor.fetchall()]
+
     def update_chart(
         self,
         message_id: int,
@@ -177,8 +234,8 @@ class ChartDatabase:
                 WHERE message_id = ?
             """
 
-            with self.conn:
-                cursor = self.conn.execute(query, params)
+            with self._write_transaction() as conn:
+                cursor = conn.execute(query, params)
 
             updated = cursor.rowcount > 0
             if updated:
@@ -198,8 +255,8 @@ class ChartDatabase:
             True if deleted, False if not found
         """
         try:
-            with self.conn:
-                cursor = self.conn.execute("""
+            with self._write_transaction() as conn:
+                cursor = conn.execute("""
                     DELETE FROM chart_messages
                     WHERE message_id = ?
                 """, (message_id,))
@@ -213,6 +270,10 @@ class ChartDatabase:
             return False
 
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close all database connections."""
+        with self._write_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            self._writer.close()
         logger.info("Database connection closed")
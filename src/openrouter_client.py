@@ -1,21 +1,155 @@
 """OpenRouter API client for AI-powered news summarization."""
 
 import httpx
+import orjson
+import pandas as pd
 import asyncio
+import hashlib
+import random
 import time
 import logging
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_UNIX_EPOCH = pd.Timestamp("1970-01-01", tz="UTC")
+
+# Static prompt text is built once at import; only the variable parts are filled per call
+_SUMMARY_PROMPT_TEMPLATE = """You are a financial news analyst. Your job is to summarize what's actually in the headlines, not add speculation.
+
+User Question: {query}
+
+News Headlines (last {hours} hours):
+{news}
+
+Instructions:
+1. Report what's ACTUALLY in the headlines - stick to the facts
+2. Answer the user's question directly using only information from the news
+3. If making connections between events, clearly state "This connection might suggest..." or "These events could be related because..."
+4. Avoid speculative language like "typically", "usually", "may indicate" unless you're explicitly noting a potential connection
+5. Focus on: What happened? What do the headlines say? What connections exist between the events?
+
+Keep it factual, direct, and concise (2-3 paragraphs max). Report the news, don't interpret beyond what's explicitly stated."""
+
+_PROPHECY_PROMPT_TEMPLATE = """You are a financial shitpost oracle - the vibe is "smart people goofing around". You've read the news and now you're going to make an absurd but technically-news-informed prophecy.
+
+User's Question: {question}
+
+Recent Market Headlines (last 8 hours):
+{news}
+
+Style: {style_name} - {style_description}
+Examples of this style:
+{examples}
+
+Instructions:
+1. Generate ONE shitpost prophecy loosely based on themes from the headlines
+2. Be vague and absurd - this is a SHITPOST not actual advice
+3. Reference news themes in a silly way (e.g., "the bonds are bond-ing", "manufacturing is... manufacturing")
+4. Use internet humor, meme energy, unhinged confidence about vague things
+5. DO NOT give real advice - this is comedy, not finance
+6. Keep it punchy (1-3 sentences max)
+7. Channel the energy of a very confident magic 8-ball that read Bloomberg once
+
+Generate your shitpost prophecy now (ONLY output the prophecy, no explanation):"""
+
+# Prophecy styles; one is picked at random per /8ball call
+_PROPHECY_STYLES = [
+    {
+        "name": "shitpost_8ball",
+        "description": "Absurdist 8-ball - extremely confident about completely vague things",
+        "examples": [
+            "Reply hazy, try again (but like, definitely avoid Tuesdays)",
+            "My sources say yes, but my sources are vibes and one (1) headline",
+            "Outlook not so good, but also I'm literally a magic 8-ball so grain of salt",
+            "Cannot predict now, the spirits are busy arguing on Twitter"
+        ]
+    },
+    {
+        "name": "fortune_shitpost",
+        "description": "Unhinged fortune cookie wisdom that's technically correct",
+        "examples": [
+            "Man who buy high and sell low will learn expensive lesson about gravity",
+            "The market can remain irrational longer than you can remain solvent, but have you tried being more irrational?",
+            "In the land of the blind, the one-eyed man is still refreshing his portfolio at 3am",
+            "When in doubt, zoom out (or in, or sideways, chart is chart)"
+        ]
+    },
+    {
+        "name": "galaxy_brain",
+        "description": "Pseudo-intellectual nonsense that sounds profound but means nothing",
+        "examples": [
+            "The dialectical tension between the bid-ask spread and the collective unconscious suggests a non-euclidean path forward",
+            "I have gazed into the void of market efficiency and the void has sent me 47 push notifications",
+            "The neo-keynesian implications of this headline point to either up, down, or sideways - the trinity of price action",
+            "Quantum superposition theory suggests your portfolio is both up AND down until you check it (schrodinger's port)"
+        ]
+    }
+]
+
+# Each style's examples rendered as the bullet list used in the prompt
+_PROPHECY_EXAMPLES = {
+    style["name"]: "\n".join(f'- "{ex}"' for ex in style["examples"])
+    for style in _PROPHECY_STYLES
+}
+
+
+def _split_payload(**params: Any) -> Tuple[bytes, bytes]:
+    """Pre-serialize a chat completion payload around its user message.
+
+    Args:
+        **params: Top-level payload fields other than messages (model, max_tokens, ...)
+
+    Returns:
+        (prefix, suffix) such that prefix + orjson.dumps(prompt) + suffix is the full JSON body
+    """
+    placeholder = "\x00prompt\x00"
+    scaffold = orjson.dumps({
+        "model": params.pop("model"),
+        "messages": [{"role": "user", "content": placeholder}],
+        **params
+    })
+    prefix, suffix = scaffold.split(orjson.dumps(placeholder))
+    return prefix, suffix
+
 
 class OpenRouterClient:
     """Client for interacting with OpenRouter API using Claude Haiku 4.5."""
 
     BASE_URL = "https://openrouter.ai/api/v1"
+    COMPLETIONS_URL = BASE_URL + "/chat/completions"
     MODEL = "anthropic/claude-haiku-4.5"
     REQUEST_DELAY = 0.1  # 100ms between requests
+    # Retries for transport failures (timeouts, dropped connections)
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 0.2  # seconds, doubled each attempt
+    # Identical prompts within this window reuse the previous summary
+    SUMMARY_CACHE_TTL = 60.0  # seconds
+    SUMMARY_CACHE_SIZE = 64
+
+    # Request bodies pre-serialized around the single user message; only the
+    # JSON-escaped prompt is encoded per call (prefix + orjson.dumps(prompt) + suffix)
+    _SUMMARY_PAYLOAD_PREFIX, _SUMMARY_PAYLOAD_SUFFIX = _split_payload(
+        model=MODEL,
+        max_tokens=1000,
+        temperature=0.7,
+        stream=True
+    )
+    _PROPHECY_PAYLOAD_PREFIX, _PROPHECY_PAYLOAD_SUFFIX = _split_payload(
+        model=MODEL,
+        max_tokens=200,
+        temperature=1.0  # Maximum temperature for peak shitpost energy
+    )
+
+    __slots__ = (
+        "api_key",
+        "headers",
+        "_last_request_time",
+        "_rate_limit_lock",
+        "_summary_cache",
+        "_client"
+    )
 
     def __init__(self, api_key: str):
         """Initialize the OpenRouter client.
@@ -30,18 +164,65 @@ class OpenRouterClient:
             "HTTP-Referer": "https://github.com/DigiBugCat/GLDfish",
             "X-Title": "GLDfish Discord Bot"
         }
+        # Monotonic timestamp of the last request; the lock serializes concurrent callers
         self._last_request_time = 0.0
+        self._rate_limit_lock = asyncio.Lock()
+        # LRU of prompt digest -> (monotonic insert time, summary)
+        self._summary_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        # Persistent client so connections (and the TLS session) are reused across calls
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
 
     async def _rate_limit(self):
         """Apply rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        async with self._rate_limit_lock:
+            time_since_last_request = time.monotonic() - self._last_request_time
 
-        if time_since_last_request < self.REQUEST_DELAY:
-            delay = self.REQUEST_DELAY - time_since_last_request
-            await asyncio.sleep(delay)
+            if time_since_last_request < self.REQUEST_DELAY:
+                delay = self.REQUEST_DELAY - time_since_last_request
+                await asyncio.sleep(delay)
 
-        self._last_request_time = time.time()
+            self._last_request_time = time.monotonic()
+
+    async def _send_with_retry(
+        self,
+        request: httpx.Request,
+        stream: bool = False
+    ) -> httpx.Response:
+        """Send a prebuilt request, retrying transport failures with exponential backoff.
+
+        The same Request object (headers, URL and serialized body) is reused on every
+        attempt, so nothing is rebuilt between retries.
+
+        Args:
+            request: Request built with self._client.build_request
+            stream: If True, return before reading the body (caller must aclose())
+
+        Returns:
+            HTTP response
+
+        Raises:
+            httpx.TransportError: If every attempt fails to connect/complete
+        """
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return await self._client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    logger.error(f"OpenRouter request failed, exhausted all {self.MAX_RETRIES} retries: {e}")
+                    raise
+
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                logger.warning(f"OpenRouter request failed ({e}), waiting {delay:.1f}s before retry {attempt + 1}/{self.MAX_RETRIES}")
+                await asyncio.sleep(delay)
 
     def filter_news_by_time(
         self,
@@ -57,24 +238,24 @@ class OpenRouterClient:
         Returns:
             Filtered list of news items within the time window
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        filtered_items = []
+        # Parse only items we haven't seen before and remember their epoch on the item,
+        # so repeat filtering of the same headlines is a plain float comparison
+        unparsed_items = [item for item in news_items if "_ts_epoch" not in item]
+        if unparsed_items:
+            timestamps = [item.get("created_at", "") for item in unparsed_items]
 
-        for item in news_items:
-            created_at_str = item.get("created_at", "")
-            if not created_at_str:
-                continue
+            # Parse all ISO 8601 timestamps in one vectorized pass (unparseable -> NaT -> NaN)
+            created_at = pd.to_datetime(timestamps, utc=True, errors="coerce", format="ISO8601")
+            epochs = (created_at - _UNIX_EPOCH) / pd.Timedelta(seconds=1)
 
-            try:
-                # Parse ISO 8601 timestamp
-                created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                created_at = created_at.replace(tzinfo=None)  # Remove timezone for comparison
+            for item, created_at_str, epoch in zip(unparsed_items, timestamps, epochs):
+                if epoch != epoch and created_at_str:  # NaN
+                    logger.warning(f"Could not parse timestamp {created_at_str}")
+                item["_ts_epoch"] = epoch
 
-                if created_at >= cutoff_time:
-                    filtered_items.append(item)
-            except Exception as e:
-                logger.warning(f"Could not parse timestamp {created_at_str}: {e}")
-                continue
+        # NaN never compares >= cutoff, so missing/bad timestamps are dropped
+        cutoff_epoch = time.time() - hours * 3600
+        filtered_items = [item for item in news_items if item["_ts_epoch"] >= cutoff_epoch]
 
         logger.info(f"Filtered {len(filtered_items)} news items from last {hours} hours (out of {len(news_items)} total)")
         return filtered_items
@@ -95,7 +276,31 @@ class OpenRouterClient:
         Returns:
             AI-generated summary string
         """
-        await self._rate_limit()
+        chunks = [chunk async for chunk in self.summarize_news_stream(news_items, user_query, hours)]
+        return "".join(chunks)
+
+    async def summarize_news_stream(
+        self,
+        news_items: List[Dict[str, Any]],
+        user_query: str = None,
+        hours: int = 4
+    ) -> AsyncIterator[str]:
+        """Stream a market news summary as Claude Haiku 4.5 generates it.
+
+        Uses OpenRouter's server-sent events mode so callers can show text as soon
+        as the first tokens arrive instead of waiting for the full completion.
+
+        Args:
+            news_items: List of news headline dictionaries from UW API
+            user_query: Optional user question/query
+            hours: Number of hours of news being analyzed
+
+        Yields:
+            Chunks of the AI-generated summary, in order
+        """
+        if not news_items:
+            yield "No recent headlines in the selected window."
+            return
 
         # Format news items for the prompt
         formatted_news = self._format_news_for_prompt(news_items)
@@ -103,71 +308,111 @@ class OpenRouterClient:
         # Build the prompt
         prompt = self._build_prompt(formatted_news, user_query, hours)
 
+        # Reuse a recent summary for an identical prompt (same headlines, question and window)
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        cached_summary = self._get_cached_summary(cache_key)
+        if cached_summary is not None:
+            logger.info("Returning cached news summary")
+            yield cached_summary
+            return
+
+        await self._rate_limit()
+
         # Call OpenRouter API
-        url = f"{self.BASE_URL}/chat/completions"
-
-        payload = {
-            "model": self.MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 1000,
-            "temperature": 0.7
-        }
+        body = self._SUMMARY_PAYLOAD_PREFIX + orjson.dumps(prompt) + self._SUMMARY_PAYLOAD_SUFFIX
+
+        summary_parts = []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload
-                )
+            # Content-Type: application/json is already set on the client headers
+            request = self._client.build_request("POST", self.COMPLETIONS_URL, content=body)
+            response = await self._send_with_retry(request, stream=True)
+
+            try:
                 response.raise_for_status()
-                data = response.json()
 
-                # Extract the summary from response
-                summary = data["choices"][0]["message"]["content"]
+                async for line in response.aiter_lines():
+                    # SSE: payload lines start with "data: "; ": ..." lines are keep-alive comments
+                    if not line.startswith("data: "):
+                        continue
+
+                    data_str = line[6:]
+                    if data_str == "[DONE]":
+                        break
+
+                    data = orjson.loads(data_str)
+                    if "error" in data:
+                        raise RuntimeError(f"OpenRouter stream error: {data['error']}")
 
-                logger.info(f"Generated news summary using {self.MODEL}")
-                return summary
+                    # Extract the next piece of the summary from the delta
+                    choices = data.get("choices")
+                    content = choices[0].get("delta", {}).get("content") if choices else None
+                    if content:
+                        summary_parts.append(content)
+                        yield content
+            finally:
+                await response.aclose()
 
         except Exception as e:
             logger.error(f"Error calling OpenRouter API: {e}", exc_info=True)
             raise
 
-    def _format_news_for_prompt(self, news_items: List[Dict[str, Any]]) -> str:
-        """Format news items into a readable string for the AI prompt.
+        if not summary_parts:
+            # Keep-alive-only or truncated stream: don't cache an empty summary
+            logger.warning(f"OpenRouter stream from {self.MODEL} returned no content")
+            return
+
+        logger.info(f"Generated news summary using {self.MODEL}")
+        self._store_summary(cache_key, "".join(summary_parts))
+
+    def _get_cached_summary(self, key: bytes) -> Optional[str]:
+        """Return a cached summary if present and not expired.
 
         Args:
-            news_items: List of news dictionaries
+            key: Digest of the prompt
 
         Returns:
-            Formatted string with all news items
+            Cached summary string, or None on miss/expiry
         """
-        formatted_lines = []
+        entry = self._summary_cache.get(key)
+        if entry is None:
+            return None
 
-        for i, item in enumerate(news_items, 1):
-            tickers = ", ".join(item.get("tickers", []))
-            headline = item.get("headline", "")
-            is_major = "⭐ MAJOR" if item.get("is_major", False) else ""
-            source = item.get("source", "Unknown")
-            created_at = item.get("created_at", "")
+        stored_at, summary = entry
+        if time.monotonic() - stored_at > self.SUMMARY_CACHE_TTL:
+            del self._summary_cache[key]
+            return None
 
-            # Format each news item
-            line = f"{i}. "
-            if is_major:
-                line += f"{is_major} "
-            if tickers:
-                line += f"[{tickers}] "
-            line += f"{headline}"
-            line += f" ({source}, {created_at})"
+        self._summary_cache.move_to_end(key)
+        return summary
 
-            formatted_lines.append(line)
+    def _store_summary(self, key: bytes, summary: str):
+        """Insert a summary into the cache, evicting the oldest entries beyond the size cap."""
+        self._summary_cache[key] = (time.monotonic(), summary)
+        self._summary_cache.move_to_end(key)
+        while len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+
+    def _format_news_for_prompt(self, news_items: List[Dict[str, Any]]) -> str:
+        """Format news items into a readable string for the AI prompt.
 
-        return "\n".join(formatted_lines)
+        Args:
+            news_items: List of news dictionaries
+
+        Returns:
+            Formatted string with all news items
+        """
+        if not news_items:
+            return ""
+
+        # Build each line with a single f-string: "N. [⭐ MAJOR ][[TICKERS] ]headline (source, time)"
+        return "\n".join(
+            f"{i}. "
+            f"{'⭐ MAJOR ' if item.get('is_major', False) else ''}"
+            f"{'[' + ', '.join(item['tickers']) + '] ' if item.get('tickers') else ''}"
+            f"{item.get('headline', '')} ({item.get('source', 'Unknown')}, {item.get('created_at', '')})"
+            for i, item in enumerate(news_items, 1)
+        )
 
     def _build_prompt(
         self,
@@ -187,23 +432,11 @@ class OpenRouterClient:
         """
         query_text = user_query if user_query else "What's happening in the market right now?"
 
-        prompt = f"""You are a financial news analyst. Your job is to summarize what's actually in the headlines, not add speculation.
-
-User Question: {query_text}
-
-News Headlines (last {hours} hours):
-{formatted_news}
-
-Instructions:
-1. Report what's ACTUALLY in the headlines - stick to the facts
-2. Answer the user's question directly using only information from the news
-3. If making connections between events, clearly state "This connection might suggest..." or "These events could be related because..."
-4. Avoid speculative language like "typically", "usually", "may indicate" unless you're explicitly noting a potential connection
-5. Focus on: What happened? What do the headlines say? What connections exist between the events?
-
-Keep it factual, direct, and concise (2-3 paragraphs max). Report the news, don't interpret beyond what's explicitly stated."""
-
-        return prompt
+        return _SUMMARY_PROMPT_TEMPLATE.format(
+            query=query_text,
+            hours=hours,
+            news=formatted_news
+        )
 
     async def generate_prophecy(
         self,
@@ -219,7 +452,9 @@ Keep it factual, direct, and concise (2-3 paragraphs max). Report the news, don'
         Returns:
             A cryptic, vague prophecy string
         """
-        import random
+        if not news_items:
+            # Nothing to read the tea leaves from - skip the API call entirely
+            return "Reply hazy, the headlines are empty. Ask again when the news wakes up."
 
         await self._rate_limit()
 
@@ -227,98 +462,36 @@ Keep it factual, direct, and concise (2-3 paragraphs max). Report the news, don'
         formatted_news = self._format_news_for_prompt(news_items)
 
         # Randomly select a prophecy style
-        styles = [
-            {
-                "name": "shitpost_8ball",
-                "description": "Absurdist 8-ball - extremely confident about completely vague things",
-                "examples": [
-                    "Reply hazy, try again (but like, definitely avoid Tuesdays)",
-                    "My sources say yes, but my sources are vibes and one (1) headline",
-                    "Outlook not so good, but also I'm literally a magic 8-ball so grain of salt",
-                    "Cannot predict now, the spirits are busy arguing on Twitter"
-                ]
-            },
-            {
-                "name": "fortune_shitpost",
-                "description": "Unhinged fortune cookie wisdom that's technically correct",
-                "examples": [
-                    "Man who buy high and sell low will learn expensive lesson about gravity",
-                    "The market can remain irrational longer than you can remain solvent, but have you tried being more irrational?",
-                    "In the land of the blind, the one-eyed man is still refreshing his portfolio at 3am",
-                    "When in doubt, zoom out (or in, or sideways, chart is chart)"
-                ]
-            },
-            {
-                "name": "galaxy_brain",
-                "description": "Pseudo-intellectual nonsense that sounds profound but means nothing",
-                "examples": [
-                    "The dialectical tension between the bid-ask spread and the collective unconscious suggests a non-euclidean path forward",
-                    "I have gazed into the void of market efficiency and the void has sent me 47 push notifications",
-                    "The neo-keynesian implications of this headline point to either up, down, or sideways - the trinity of price action",
-                    "Quantum superposition theory suggests your portfolio is both up AND down until you check it (schrodinger's port)"
-                ]
-            }
-        ]
-
-        selected_style = random.choice(styles)
+        selected_style = random.choice(_PROPHECY_STYLES)
 
         # Build the prophecy prompt
         question_text = user_question if user_question else "What does the market hold?"
 
-        prompt = f"""You are a financial shitpost oracle - the vibe is "smart people goofing around". You've read the news and now you're going to make an absurd but technically-news-informed prophecy.
-
-User's Question: {question_text}
-
-Recent Market Headlines (last 8 hours):
-{formatted_news}
-
-Style: {selected_style['name']} - {selected_style['description']}
-Examples of this style:
-{chr(10).join(f'- "{ex}"' for ex in selected_style['examples'])}
-
-Instructions:
-1. Generate ONE shitpost prophecy loosely based on themes from the headlines
-2. Be vague and absurd - this is a SHITPOST not actual advice
-3. Reference news themes in a silly way (e.g., "the bonds are bond-ing", "manufacturing is... manufacturing")
-4. Use internet humor, meme energy, unhinged confidence about vague things
-5. DO NOT give real advice - this is comedy, not finance
-6. Keep it punchy (1-3 sentences max)
-7. Channel the energy of a very confident magic 8-ball that read Bloomberg once
-
-Generate your shitpost prophecy now (ONLY output the prophecy, no explanation):"""
+        prompt = _PROPHECY_PROMPT_TEMPLATE.format(
+            question=question_text,
+            news=formatted_news,
+            style_name=selected_style['name'],
+            style_description=selected_style['description'],
+            examples=_PROPHECY_EXAMPLES[selected_style['name']]
+        )
 
         # Call OpenRouter API
-        url = f"{self.BASE_URL}/chat/completions"
-
-        payload = {
-            "model": self.MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 200,
-            "temperature": 1.0  # Maximum temperature for peak shitpost energy
-        }
+        body = self._PROPHECY_PAYLOAD_PREFIX + orjson.dumps(prompt) + self._PROPHECY_PAYLOAD_SUFFIX
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract the prophecy from response
-                prophecy = data["choices"][0]["message"]["content"].strip()
-                # Remove any quotes if the AI wrapped the response
-                prophecy = prophecy.strip('"\'')
-
-                logger.info(f"Generated prophecy in {selected_style['name']} style")
-                return prophecy
+            # Content-Type: application/json is already set on the client headers
+            request = self._client.build_request("POST", self.COMPLETIONS_URL, content=body)
+            response = await self._send_with_retry(request)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            # Extract the prophecy from response
+            prophecy = data["choices"][0]["message"]["content"].strip()
+            # Remove any quotes if the AI wrapped the response
+            prophecy = prophecy.strip('"\'')
+
+            logger.info(f"Generated prophecy in {selected_style['name']} style")
+            return prophecy
 
         except Exception as e:
             logger.error(f"Error calling OpenRouter API for prophecy: {e}", exc_info=True)
@@ -1,9 +1,17 @@
 """Utility functions for strike selection and IV interpolation."""
 
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Iterable, Set, Callable
+from functools import lru_cache
 from datetime import datetime, timedelta, date
 import logging
 import asyncio
+import bisect
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy kernels are used without it
+    njit = None
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +36,38 @@ def find_closest_strikes(
 
     sorted_strikes = sorted(available_strikes)
 
-    # Find strikes on either side of spot price
-    lower_strikes = [s for s in sorted_strikes if s <= spot_price]
-    upper_strikes = [s for s in sorted_strikes if s > spot_price]
+    # Binary search for the split point: everything before idx is <= spot
+    idx = bisect.bisect_right(sorted_strikes, spot_price)
+    return _strikes_around(sorted_strikes, idx, num_strikes)
+
+
+def _strikes_around(
+    sorted_strikes: List[float],
+    idx: int,
+    num_strikes: int
+) -> List[float]:
+    """Pick the closest strikes on either side of a bisect_right split point.
+
+    Args:
+        sorted_strikes: Strike prices, sorted ascending
+        idx: Split point; sorted_strikes[:idx] <= spot < sorted_strikes[idx:]
+        num_strikes: Number of closest strikes to return
+
+    Returns:
+        List of closest strikes, sorted
+    """
+    # Fast path for the default pair: the strikes either side of the split,
+    # or the two outermost strikes when the spot is beyond the range
+    if num_strikes == 2:
+        if idx == 0:
+            return sorted_strikes[:2]
+        if idx >= len(sorted_strikes):
+            return sorted_strikes[-2:]
+        return [sorted_strikes[idx - 1], sorted_strikes[idx]]
+
+    # Only the two nearest strikes on each side can ever be selected
+    lower_strikes = sorted_strikes[max(0, idx - 2):idx]
+    upper_strikes = sorted_strikes[idx:idx + 2]
 
     # Get closest from each side
     closest = []
@@ -46,7 +83,44 @@ def find_closest_strikes(
         if len(upper_strikes) > 1 and len(closest) < num_strikes:
             closest.append(upper_strikes[1])
 
-    return sorted(closest)
+    # Lower picks are prepended and upper picks appended, so this is already sorted
+    return closest
+
+
+def _required_strikes(
+    sorted_strikes: List[float],
+    spot_prices: Iterable[float],
+    num_strikes: int = 2
+) -> Set[float]:
+    """Find the union of the closest strikes for many spot prices.
+
+    Prices sharing a split point select the same strikes, so the selection is
+    only built once per distinct split point. When the lowest and highest price
+    share one, every price in between does too and the rest are skipped.
+
+    Args:
+        sorted_strikes: Available strike prices, sorted ascending
+        spot_prices: Underlying prices
+        num_strikes: Number of closest strikes per price (default: 2)
+
+    Returns:
+        Set of strikes selected by any of the prices
+    """
+    spot_prices = list(spot_prices)
+    if not spot_prices or not sorted_strikes:
+        return set()
+
+    split = bisect.bisect_right
+    low_split = split(sorted_strikes, min(spot_prices))
+    if low_split == split(sorted_strikes, max(spot_prices)):
+        split_points = {low_split}
+    else:
+        split_points = {split(sorted_strikes, spot_price) for spot_price in spot_prices}
+
+    required_strikes: Set[float] = set()
+    for idx in split_points:
+        required_strikes.update(_strikes_around(sorted_strikes, idx, num_strikes))
+    return required_strikes
 
 
 def identify_required_strikes(
@@ -62,20 +136,49 @@ def identify_required_strikes(
     Returns:
         List of unique strikes needed (sorted)
     """
-    required_strikes = set()
-
-    for candle in ohlc_data:
-        # Use close price to determine ATM
-        close_price = float(candle.get("close", 0))
-        if close_price > 0:
-            closest = find_closest_strikes(close_price, available_strikes, num_strikes=3)
-            required_strikes.update(closest)
-
-    strikes_list = sorted(list(required_strikes))
-    logger.info(f"Identified {len(strikes_list)} required strikes: {strikes_list}")
+    # Use close price to determine ATM
+    close_prices = (float(candle.get("close", 0)) for candle in ohlc_data)
+    required_strikes = _required_strikes(
+        sorted(available_strikes),
+        (close_price for close_price in close_prices if close_price > 0),
+        num_strikes=3
+    )
+
+    strikes_list = sorted(required_strikes)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Identified {len(strikes_list)} required strikes: {strikes_list}")
     return strikes_list
 
 
+def _timestamp_date(timestamp: str) -> Optional[str]:
+    """Extract the YYYY-MM-DD date from an ISO 8601 timestamp.
+
+    ISO timestamps start with the date, so it is sliced off directly; full
+    parsing is only used for strings that don't look like YYYY-MM-DD...
+
+    Args:
+        timestamp: ISO 8601 timestamp string
+
+    Returns:
+        Date string (YYYY-MM-DD), or None if the timestamp can't be parsed
+    """
+    if (
+        isinstance(timestamp, str)
+        and len(timestamp) >= 10
+        and timestamp[4] == '-'
+        and timestamp[7] == '-'
+        and timestamp[:4].isdigit()
+    ):
+        return timestamp[:10]
+
+    try:
+        dt = datetime.fromisoformat(timestamp)
+        return dt.strftime("%Y-%m-%d")
+    except Exception as e:
+        logger.warning(f"Could not parse timestamp {timestamp}: {e}")
+        return None
+
+
 def identify_required_strikes_by_date(
     ohlc_data: List[Dict[str, Any]],
     available_strikes: List[float]
@@ -96,59 +199,200 @@ def identify_required_strikes_by_date(
         Dictionary mapping date strings (YYYY-MM-DD) to list of required strikes
         Example: {"2025-10-20": [370.0, 375.0, 380.0], "2025-10-21": [365.0, 370.0, 375.0]}
     """
-    from datetime import datetime
-
-    # Group candles by date
-    candles_by_date: Dict[str, List[Dict[str, Any]]] = {}
+    # One pass to pull out each timestamped candle's date and close price
+    dates: List[str] = []
+    close_prices: List[float] = []
 
     for candle in ohlc_data:
         timestamp = candle.get("start_time") or candle.get("timestamp")
         if not timestamp:
             continue
 
-        # Parse timestamp and extract date
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            date_str = dt.strftime("%Y-%m-%d")
-
-            if date_str not in candles_by_date:
-                candles_by_date[date_str] = []
-            candles_by_date[date_str].append(candle)
-        except Exception as e:
-            logger.warning(f"Could not parse timestamp {timestamp}: {e}")
+        date_str = _timestamp_date(timestamp)
+        if date_str is None:
             continue
+        dates.append(date_str)
+        close_prices.append(float(candle.get("close", 0)))
+
+    # Split point of every close in one vectorized search; candles sharing a
+    # date and split point select the same strikes, so only distinct pairs count
+    sorted_strikes = sorted(available_strikes)
+    unique_dates, date_index = np.unique(np.array(dates, dtype=str), return_inverse=True)
+    close_array = np.array(close_prices, dtype=np.float64)
+    split_points = np.searchsorted(np.array(sorted_strikes, dtype=np.float64), close_array, side="right")
+
+    positive = close_array > 0
+    date_splits = np.unique(np.stack([date_index[positive], split_points[positive]]), axis=1)
+
+    required_by_date: List[Set[float]] = [set() for _ in range(len(unique_dates))]
+    for day, idx in date_splits.T.tolist():
+        required_by_date[day].update(_strikes_around(sorted_strikes, idx, 3))
 
     # For each date, identify required strikes based on that day's price range
     strikes_by_date: Dict[str, List[float]] = {}
 
-    for date_str, candles in candles_by_date.items():
-        required_strikes = set()
+    for date_str, required_strikes in zip(unique_dates.tolist(), required_by_date):
+        strikes_by_date[date_str] = sorted(required_strikes)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Date {date_str}: {len(strikes_by_date[date_str])} strikes needed "
+                f"({strikes_by_date[date_str]})"
+            )
 
-        # Find price range for this specific day
-        for candle in candles:
-            close_price = float(candle.get("close", 0))
-            if close_price > 0:
-                closest = find_closest_strikes(close_price, available_strikes, num_strikes=3)
-                required_strikes.update(closest)
+    # Log optimization stats (naive = every strike needed on any day, fetched for every day)
+    if logger.isEnabledFor(logging.INFO):
+        total_combinations = sum(len(strikes) for strikes in strikes_by_date.values())
+        naive_combinations = len(set().union(*strikes_by_date.values())) * len(strikes_by_date)
+        saved = naive_combinations - total_combinations
+        if naive_combinations > 0:
+            saved_pct = (saved / naive_combinations) * 100
+            logger.info(
+                f"Optimization: {total_combinations} strike/date combinations needed "
+                f"(vs {naive_combinations} naively) - saved {saved} API calls ({saved_pct:.1f}%)"
+            )
 
-        strikes_by_date[date_str] = sorted(list(required_strikes))
-        logger.info(
-            f"Date {date_str}: {len(strikes_by_date[date_str])} strikes needed "
-            f"({strikes_by_date[date_str]})"
-        )
+    return strikes_by_date
 
-    # Log optimization stats
-    total_combinations = sum(len(strikes) for strikes in strikes_by_date.values())
-    naive_combinations = len(identify_required_strikes(ohlc_data, available_strikes)) * len(strikes_by_date)
-    saved = naive_combinations - total_combinations
-    if naive_combinations > 0:
-        saved_pct = (saved / naive_combinations) * 100
-        logger.info(
-            f"Optimization: {total_combinations} strike/date combinations needed "
-            f"(vs {naive_combinations} naively) - saved {saved} API calls ({saved_pct:.1f}%)"
-        )
 
-    return strikes_by_date
+def _sorted_iv_arrays(strike_to_iv: Dict[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a strike -> IV mapping into parallel arrays sorted by strike.
+
+    Args:
+        strike_to_iv: Dictionary mapping strike prices to IV values
+
+    Returns:
+        Tuple of (strikes, ivs) float arrays, sorted by strike
+    """
+    strikes = np.fromiter(strike_to_iv.keys(), dtype=np.float64, count=len(strike_to_iv))
+    ivs = np.fromiter(strike_to_iv.values(), dtype=np.float64, count=len(strike_to_iv))
+    order = np.argsort(strikes, kind="stable")
+    return strikes[order], ivs[order]
+
+
+def _interpolate_sorted(
+    spot_price: float,
+    strikes: np.ndarray,
+    ivs: np.ndarray
+) -> float:
+    """Interpolate IV from parallel sorted strike/IV arrays without Python-level branching.
+
+    Outside the strike range the nearest strike's IV is used (flat extrapolation).
+
+    Args:
+        spot_price: Current underlying price
+        strikes: Non-empty strike array, sorted ascending
+        ivs: IV values parallel to strikes
+
+    Returns:
+        Interpolated IV value
+    """
+    last = len(strikes) - 1
+
+    # strikes[:idx] <= spot < strikes[idx:]; clipping makes both edges collapse onto one strike
+    idx = np.searchsorted(strikes, spot_price, side="right")
+    lower = np.clip(idx - 1, 0, last)
+    upper = np.clip(idx, 0, last)
+
+    # Zero span (edge or single strike) -> weight 0 -> lower strike's IV
+    span = strikes[upper] - strikes[lower]
+    weight = np.divide(spot_price - strikes[lower], span, out=np.zeros_like(span), where=span != 0)
+
+    return float(ivs[lower] + weight * (ivs[upper] - ivs[lower]))
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _interpolate_iv_kernel(spot_prices, rows, strikes, iv_matrix, out):
+        """Compiled equivalent of _interpolate_iv_batch(), writing into out."""
+        num_cols = strikes.size
+        for i in prange(spot_prices.size):
+            row = rows[i]
+            if row < 0:
+                out[i] = np.nan
+                continue
+
+            # Nearest strikes with IV on either side: lower <= spot < upper
+            split = np.searchsorted(strikes, spot_prices[i], side="right")
+            lower = split - 1
+            while lower >= 0 and np.isnan(iv_matrix[row, lower]):
+                lower -= 1
+            upper = split
+            while upper < num_cols and np.isnan(iv_matrix[row, upper]):
+                upper += 1
+
+            # Outside the available strikes, use the nearest one (flat extrapolation)
+            if lower < 0 and upper >= num_cols:
+                out[i] = np.nan
+            elif lower < 0:
+                out[i] = iv_matrix[row, upper]
+            elif upper >= num_cols:
+                out[i] = iv_matrix[row, lower]
+            else:
+                lower_iv = iv_matrix[row, lower]
+                span = strikes[upper] - strikes[lower]
+                weight = (spot_prices[i] - strikes[lower]) / span if span != 0 else 0.0
+                out[i] = lower_iv + weight * (iv_matrix[row, upper] - lower_iv)
+else:
+    _interpolate_iv_kernel = None
+
+
+def _interpolate_iv_batch(
+    spot_prices: np.ndarray,
+    rows: np.ndarray,
+    strikes: np.ndarray,
+    iv_matrix: np.ndarray
+) -> np.ndarray:
+    """Interpolate IV for many spot prices at once against rows of an IV matrix.
+
+    Each spot price is interpolated using only the strikes that have IV in its
+    row, exactly like interpolate_iv() on that row's strike -> IV mapping.
+
+    Args:
+        spot_prices: Spot price per point, shape (N,)
+        rows: iv_matrix row per point, shape (N,); -1 if the point has no row
+        strikes: Strike axis sorted ascending, shape (K,)
+        iv_matrix: IV values, shape (T, K); NaN where a strike has no IV
+
+    Returns:
+        Interpolated IV per point, shape (N,); NaN where no IV is available
+    """
+    num_cols = iv_matrix.shape[1]
+    if iv_matrix.size == 0 or len(spot_prices) == 0:
+        return np.full(len(spot_prices), np.nan)
+
+    if _interpolate_iv_kernel is not None:
+        out = np.empty(len(spot_prices), dtype=iv_matrix.dtype)
+        _interpolate_iv_kernel(spot_prices, rows, strikes, iv_matrix, out)
+        return out
+
+    # For every cell, the nearest column with IV at-or-before / at-or-after it (-1 / K if none)
+    cols = np.arange(num_cols)
+    has_iv = ~np.isnan(iv_matrix)
+    prev_valid = np.maximum.accumulate(np.where(has_iv, cols, -1), axis=1)
+    next_valid = np.minimum.accumulate(np.where(has_iv, cols, num_cols)[:, ::-1], axis=1)[:, ::-1]
+
+    has_row = rows >= 0
+    row = np.where(has_row, rows, 0)
+
+    # Bracketing strikes among those with IV: lower <= spot < upper
+    split = np.searchsorted(strikes, spot_prices, side="right")
+    lower = np.where(split > 0, prev_valid[row, np.maximum(split - 1, 0)], -1)
+    upper = np.where(split < num_cols, next_valid[row, np.minimum(split, num_cols - 1)], num_cols)
+
+    # Outside the available strikes, use the nearest one (flat extrapolation)
+    first = next_valid[row, 0]
+    last = prev_valid[row, num_cols - 1]
+    lower = np.clip(np.where(lower < 0, first, lower), 0, num_cols - 1)
+    upper = np.clip(np.where(upper >= num_cols, last, upper), 0, num_cols - 1)
+
+    lower_iv = iv_matrix[row, lower]
+    upper_iv = iv_matrix[row, upper]
+    span = strikes[upper] - strikes[lower]
+    weight = np.divide(spot_prices - strikes[lower], span, out=np.zeros_like(span), where=span != 0)
+    interpolated = lower_iv + weight * (upper_iv - lower_iv)
+
+    # Rows with no IV at all (first == K) and points without a row get NaN
+    return np.where(has_row & (first < num_cols), interpolated, np.nan)
 
 
 def interpolate_iv(
@@ -167,196 +411,291 @@ def interpolate_iv(
     if not strike_to_iv:
         return None
 
-    strikes = sorted(strike_to_iv.keys())
-
-    # Find bracketing strikes
-    lower_strike = None
-    upper_strike = None
+    return _interpolate_sorted(spot_price, *_sorted_iv_arrays(strike_to_iv))
 
-    for strike in strikes:
-        if strike <= spot_price:
-            lower_strike = strike
-        if strike > spot_price and upper_strike is None:
-            upper_strike = strike
 
-    # Edge cases
-    if lower_strike is None:
-        # Spot below all strikes - use lowest strike IV
-        return strike_to_iv[strikes[0]]
+def _build_iv_matrix(
+    num_rows: int,
+    strike_ids: Dict[float, int],
+    row_ids: List[int],
+    col_ids: List[int],
+    iv_values: List[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Scatter (row id, strike id, IV) triples into a dense IV matrix.
 
-    if upper_strike is None:
-        # Spot above all strikes - use highest strike IV
-        return strike_to_iv[strikes[-1]]
+    Columns are reordered so strikes ascend; missing cells are NaN and later
+    duplicates win. IV only carries a few significant digits, so everything is
+    stored as float32.
 
-    if lower_strike == upper_strike:
-        # Exact match
-        return strike_to_iv[lower_strike]
-
-    # Linear interpolation
-    lower_iv = strike_to_iv[lower_strike]
-    upper_iv = strike_to_iv[upper_strike]
+    Args:
+        num_rows: Number of matrix rows (timestamps or dates)
+        strike_ids: Mapping of strike price to its column id
+        row_ids: Row id of each IV value
+        col_ids: Strike column id of each IV value
+        iv_values: IV values
 
-    weight = (spot_price - lower_strike) / (upper_strike - lower_strike)
-    interpolated_iv = lower_iv + weight * (upper_iv - lower_iv)
+    Returns:
+        Tuple of (strikes, iv_matrix): the ascending strike axis, shape (K,),
+        and the IV matrix, shape (num_rows, K)
+    """
+    strikes = np.fromiter(strike_ids, dtype=np.float32, count=len(strike_ids))
+    order = np.argsort(strikes, kind="stable")
+    strikes = strikes[order]
+    sorted_col = np.empty(len(order), dtype=np.intp)
+    sorted_col[order] = np.arange(len(order))
 
-    return interpolated_iv
+    iv_matrix = np.full((num_rows, len(strike_ids)), np.nan, dtype=np.float32)
+    if iv_values:
+        iv_matrix[np.array(row_ids), sorted_col[np.array(col_ids)]] = iv_values
+    return strikes, iv_matrix
 
 
-def align_data_by_timestamp(
+def _align_core(
     ohlc_data: List[Dict[str, Any]],
-    iv_data_by_strike: Dict[float, List[Dict[str, Any]]]
-) -> List[Dict[str, Any]]:
-    """Align OHLC and IV data by timestamp with interpolation.
+    iv_data_by_strike: Dict[float, List[Dict[str, Any]]],
+    iv_key_fn: Callable[[Dict[str, Any]], Optional[str]],
+    iv_value_fn: Callable[[Dict[str, Any]], Any],
+    candle_key_fn: Callable[[Dict[str, Any]], Optional[str]],
+    warn_unparseable: bool = False
+) -> Dict[str, np.ndarray]:
+    """Align OHLC candles with per-strike IV series on a shared key, as parallel columns.
+
+    Shared by the intraday (timestamp-keyed) and historic (date-keyed) aligners;
+    only the key and value extraction differ between them.
 
     Args:
         ohlc_data: List of OHLC candles with timestamps
-        iv_data_by_strike: Dictionary mapping strikes to their IV time series
+        iv_data_by_strike: Dictionary mapping strikes to their IV points/records
+        iv_key_fn: Returns the join key of an IV point, or None to skip it
+        iv_value_fn: Returns the raw IV value of an IV point, or None to skip it
+        candle_key_fn: Returns the join key of a candle, or None to skip it
+        warn_unparseable: Log a warning for each IV value that fails to parse
+            (otherwise such points are skipped silently)
 
     Returns:
-        List of aligned data points with interpolated IV
+        Dictionary of equal-length arrays: timestamp and market_time (object),
+        open/high/low/close (float64), volume (int64) and iv (float64, NaN where
+        no IV is available)
     """
-    aligned_data = []
-
-    # Create lookup for IV by timestamp and strike
-    iv_lookup: Dict[str, Dict[float, float]] = {}
+    # Collect (key id, strike id, IV) triples; ids are assigned in first-seen order
+    key_row: Dict[str, int] = {}
+    strike_ids: Dict[float, int] = {}
+    row_ids: List[int] = []
+    col_ids: List[int] = []
+    iv_values: List[float] = []
 
     for strike, iv_series in iv_data_by_strike.items():
         for point in iv_series:
-            # Use start_time field from API response
-            timestamp = point.get("start_time") or point.get("timestamp")
-            # Try multiple IV fields - APIs may return different formats
-            iv_value = point.get("iv") or point.get("iv_high") or point.get("iv_low")
+            key = iv_key_fn(point)
+            iv_value = iv_value_fn(point)
 
-            if timestamp and iv_value is not None:
-                iv_str = str(iv_value)
-                try:
-                    iv_float = float(iv_str)
+            if key and iv_value is not None:
+                # Already-numeric values skip float() parsing
+                if type(iv_value) is float:
+                    iv_float = iv_value
+                else:
+                    try:
+                        iv_float = float(iv_value)
+                    except (ValueError, TypeError):
+                        if warn_unparseable:
+                            logger.warning(f"Could not parse IV value for strike {strike} on {key}: {iv_value}")
+                        continue
 
-                    if timestamp not in iv_lookup:
-                        iv_lookup[timestamp] = {}
-                    iv_lookup[timestamp][strike] = iv_float
-                except (ValueError, TypeError):
-                    continue
+                row_ids.append(key_row.setdefault(key, len(key_row)))
+                col_ids.append(strike_ids.setdefault(strike, len(strike_ids)))
+                iv_values.append(iv_float)
+
+    strikes, iv_matrix = _build_iv_matrix(len(key_row), strike_ids, row_ids, col_ids, iv_values)
+
+    # Align with OHLC data, one column list per field
+    timestamps = []
+    opens = []
+    highs = []
+    lows = []
+    closes = []
+    volumes = []
+    market_times = []
+    candle_rows = []
+
+    # Bind hot-loop methods once instead of looking them up per candle
+    row_for = key_row.get
 
-    # Align with OHLC data
     for candle in ohlc_data:
+        get = candle.get
+
         # Use start_time field from API response
-        timestamp = candle.get("start_time") or candle.get("timestamp")
-        close_price = candle.get("close")
+        timestamp = get("start_time") or get("timestamp")
+        close_price = get("close")
 
         if not timestamp or close_price is None:
             continue
 
+        key = candle_key_fn(candle)
+        if key is None:
+            continue
+
         try:
             close_float = float(close_price)
         except (ValueError, TypeError):
             continue
 
-        # Get IV data for this timestamp
-        strike_to_iv = iv_lookup.get(timestamp, {})
+        timestamps.append(timestamp)
+        opens.append(float(get("open", 0)))
+        highs.append(float(get("high", 0)))
+        lows.append(float(get("low", 0)))
+        closes.append(close_float)
+        volumes.append(int(get("volume", 0)))
+        market_times.append(get("market_time"))  # Preserve market_time field
+        candle_rows.append(row_for(key, -1))
+
+    close_array = np.array(closes, dtype=np.float64)
+    return {
+        "timestamp": np.array(timestamps, dtype=object),
+        "open": np.array(opens, dtype=np.float64),
+        "high": np.array(highs, dtype=np.float64),
+        "low": np.array(lows, dtype=np.float64),
+        "close": close_array,
+        "volume": np.array(volumes, dtype=np.int64),
+        # Interpolation runs in float32; widen at the output boundary
+        "iv": _interpolate_iv_batch(
+            close_array.astype(np.float32),
+            np.array(candle_rows, dtype=np.intp),
+            strikes,
+            iv_matrix
+        ).astype(np.float64),
+        "market_time": np.array(market_times, dtype=object),
+    }
+
+
+def _candle_timestamp(candle: Dict[str, Any]) -> Optional[str]:
+    """Return a candle's or IV point's timestamp (start_time from the API)."""
+    return candle.get("start_time") or candle.get("timestamp")
+
+
+def align_data_by_timestamp_arrays(
+    ohlc_data: List[Dict[str, Any]],
+    iv_data_by_strike: Dict[float, List[Dict[str, Any]]]
+) -> Dict[str, np.ndarray]:
+    """Align OHLC and IV data by timestamp with interpolation, as parallel columns.
+
+    Args:
+        ohlc_data: List of OHLC candles with timestamps
+        iv_data_by_strike: Dictionary mapping strikes to their IV time series
+
+    Returns:
+        Dictionary of equal-length arrays: timestamp and market_time (object),
+        open/high/low/close (float64), volume (int64) and iv (float64, NaN where
+        no IV is available)
+    """
+    columns = _align_core(
+        ohlc_data,
+        iv_data_by_strike,
+        iv_key_fn=_candle_timestamp,
+        # Try multiple IV fields - APIs may return different formats
+        # (the chain stops at the first truthy field, usually "iv")
+        iv_value_fn=lambda point: point.get("iv") or point.get("iv_high") or point.get("iv_low"),
+        candle_key_fn=_candle_timestamp
+    )
+
+    logger.info(f"Aligned {len(columns['timestamp'])} data points with IV")
+    return columns
 
-        if strike_to_iv:
-            interpolated_iv = interpolate_iv(close_float, strike_to_iv)
-        else:
-            interpolated_iv = None
 
-        aligned_data.append({
+def _aligned_rows(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Convert aligned columns into the list-of-dicts form.
+
+    Args:
+        columns: Output of align_data_by_timestamp_arrays() or align_historic_data_arrays()
+
+    Returns:
+        List of aligned data points; iv is None where no IV is available
+    """
+    return [
+        {
             "timestamp": timestamp,
-            "open": float(candle.get("open", 0)),
-            "high": float(candle.get("high", 0)),
-            "low": float(candle.get("low", 0)),
-            "close": close_float,
-            "volume": int(candle.get("volume", 0)),
-            "iv": interpolated_iv,
-            "market_time": candle.get("market_time")  # Preserve market_time field
-        })
-
-    logger.info(f"Aligned {len(aligned_data)} data points with IV")
-    return aligned_data
+            "open": open_price,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "iv": iv if iv == iv else None,  # NaN means no IV for this point
+            "market_time": market_time
+        }
+        for timestamp, open_price, high, low, close, volume, iv, market_time in zip(
+            *(columns[field].tolist() for field in (
+                "timestamp", "open", "high", "low", "close", "volume", "iv", "market_time"
+            ))
+        )
+    ]
 
 
-def align_historic_data(
+def align_data_by_timestamp(
     ohlc_data: List[Dict[str, Any]],
-    historic_iv_by_strike: Dict[float, List[Dict[str, Any]]]
+    iv_data_by_strike: Dict[float, List[Dict[str, Any]]]
 ) -> List[Dict[str, Any]]:
-    """Align 4h OHLC candles with historic option IV data by date.
+    """Align OHLC and IV data by timestamp with interpolation.
 
-    This function is used for lookback periods > 7 days where we use:
-    - 4h stock candles (up to 271 days available)
-    - Historic option data (EOD IV snapshots, ~250 days available)
+    Row-oriented view of align_data_by_timestamp_arrays().
 
     Args:
-        ohlc_data: List of 4h OHLC candles with timestamps
-        historic_iv_by_strike: Dictionary mapping strikes to their historic daily records
+        ohlc_data: List of OHLC candles with timestamps
+        iv_data_by_strike: Dictionary mapping strikes to their IV time series
 
     Returns:
         List of aligned data points with interpolated IV
     """
-    aligned_data = []
+    return _aligned_rows(align_data_by_timestamp_arrays(ohlc_data, iv_data_by_strike))
 
-    # Create lookup for IV by date and strike
-    # Historic data has 'date' field (YYYY-MM-DD) not timestamp
-    iv_lookup: Dict[str, Dict[float, float]] = {}
 
-    for strike, historic_records in historic_iv_by_strike.items():
-        for record in historic_records:
-            date = record.get("date")
-            # Use implied_volatility field from historic endpoint
-            iv_value = record.get("implied_volatility")
+def align_historic_data_arrays(
+    ohlc_data: List[Dict[str, Any]],
+    historic_iv_by_strike: Dict[float, List[Dict[str, Any]]]
+) -> Dict[str, np.ndarray]:
+    """Align 4h OHLC candles with historic option IV data by date, as parallel columns.
 
-            if date and iv_value is not None:
-                try:
-                    iv_float = float(iv_value)
+    This function is used for lookback periods > 7 days where we use:
+    - 4h stock candles (up to 271 days available)
+    - Historic option data (EOD IV snapshots, ~250 days available)
 
-                    if date not in iv_lookup:
-                        iv_lookup[date] = {}
-                    iv_lookup[date][strike] = iv_float
-                except (ValueError, TypeError):
-                    logger.warning(f"Could not parse IV value for strike {strike} on {date}: {iv_value}")
-                    continue
+    Args:
+        ohlc_data: List of 4h OHLC candles with timestamps
+        historic_iv_by_strike: Dictionary mapping strikes to their historic daily records
 
-    # Align with OHLC data
-    for candle in ohlc_data:
-        timestamp = candle.get("start_time") or candle.get("timestamp")
-        close_price = candle.get("close")
+    Returns:
+        Dictionary of equal-length arrays, laid out like align_data_by_timestamp_arrays()
+    """
+    columns = _align_core(
+        ohlc_data,
+        historic_iv_by_strike,
+        # Historic data has 'date' field (YYYY-MM-DD) not timestamp
+        iv_key_fn=lambda record: record.get("date"),
+        # Use implied_volatility field from historic endpoint
+        iv_value_fn=lambda record: record.get("implied_volatility"),
+        # Extract date from timestamp (for matching with historic data)
+        candle_key_fn=lambda candle: _timestamp_date(_candle_timestamp(candle)),
+        warn_unparseable=True
+    )
 
-        if not timestamp or close_price is None:
-            continue
+    logger.info(f"Aligned {len(columns['timestamp'])} 4h candles with historic IV data")
+    return columns
 
-        # Extract date from timestamp (for matching with historic data)
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            date_str = dt.strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.warning(f"Could not parse timestamp {timestamp}: {e}")
-            continue
 
-        try:
-            close_float = float(close_price)
-        except (ValueError, TypeError):
-            continue
+def align_historic_data(
+    ohlc_data: List[Dict[str, Any]],
+    historic_iv_by_strike: Dict[float, List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Align 4h OHLC candles with historic option IV data by date.
 
-        # Get IV data for this date
-        strike_to_iv = iv_lookup.get(date_str, {})
+    Row-oriented view of align_historic_data_arrays().
 
-        if strike_to_iv:
-            interpolated_iv = interpolate_iv(close_float, strike_to_iv)
-        else:
-            interpolated_iv = None
+    Args:
+        ohlc_data: List of 4h OHLC candles with timestamps
+        historic_iv_by_strike: Dictionary mapping strikes to their historic daily records
 
-        aligned_data.append({
-            "timestamp": timestamp,
-            "open": float(candle.get("open", 0)),
-            "high": float(candle.get("high", 0)),
-            "low": float(candle.get("low", 0)),
-            "close": close_float,
-            "volume": int(candle.get("volume", 0)),
-            "iv": interpolated_iv,
-            "market_time": candle.get("market_time")  # Preserve market_time field
-        })
-
-    logger.info(f"Aligned {len(aligned_data)} 4h candles with historic IV data")
-    return aligned_data
+    Returns:
+        List of aligned data points with interpolated IV
+    """
+    return _aligned_rows(align_historic_data_arrays(ohlc_data, historic_iv_by_strike))
 
 
 async def align_constant_dte_premium_data(
@@ -413,8 +752,8 @@ async def align_constant_dte_premium_data(
             # Parse timestamp to extract date
             if 'T' in timestamp_str or 'Z' in timestamp_str:
                 # Intraday format: ISO 8601
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                date_str = dt.strftime("%Y-%m-%d")
+                dt = datetime.fromisoformat(timestamp_str)
+                date_str = dt.date().isoformat()
             else:
                 # Daily format: YYYY-MM-DD
                 date_str = timestamp_str
@@ -438,7 +777,7 @@ async def align_constant_dte_premium_data(
     contract_metadata = {}  # contract_id -> list of (date_str, timestamp_str, spot_price, target_exp_date)
 
     for date_str, candle_group in ohlc_by_date.items():
-        analysis_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        analysis_date = date.fromisoformat(date_str)
 
         # Calculate target expiration
         target_exp_date = analysis_date + timedelta(days=target_dte)
@@ -461,11 +800,11 @@ async def align_constant_dte_premium_data(
         # Generate smart strikes around spot
         strikes = generate_smart_strikes(spot_price, max_strikes=6)
 
-        # Build contract IDs
+        # Build contract IDs (symbol parts formatted once, not per combination)
+        strike_codes = [f"{int(strike * 1000):08d}" for strike in strikes]
         for exp_date in expirations_to_try:
-            for strike in strikes:
-                exp_str = exp_date.strftime("%y%m%d")
-                strike_code = f"{int(strike * 1000):08d}"
+            exp_str = _expiration_code(exp_date)
+            for strike, strike_code in zip(strikes, strike_codes):
                 contract_id = f"{ticker}{exp_str}{opt_type_code}{strike_code}"
 
                 contracts_to_fetch.add(contract_id)
@@ -571,8 +910,8 @@ async def align_constant_dte_premium_data(
         try:
             # Parse timestamp
             if 'T' in timestamp_str or 'Z' in timestamp_str:
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                date_str = dt.strftime("%Y-%m-%d")
+                dt = datetime.fromisoformat(timestamp_str)
+                date_str = dt.date().isoformat()
             else:
                 date_str = timestamp_str
                 dt = datetime.strptime(date_str, "%Y-%m-%d")
@@ -645,7 +984,7 @@ async def align_constant_dte_premium_data(
                                             best_contract = contract_id
                                             best_strike = strike
                                             best_exp_date = exp_date
-                                except:
+                                except (ValueError, TypeError):
                                     pass
                     else:
                         # Historic mode: lookup by contract_id and date
@@ -684,7 +1023,7 @@ async def align_constant_dte_premium_data(
                                                 best_contract = contract_id
                                                 best_strike = strike
                                                 best_exp_date = exp_date
-                                    except:
+                                    except (ValueError, TypeError):
                                         pass
                                 break
 
@@ -731,22 +1070,42 @@ def get_trading_dates(days_back: int) -> List[str]:
     Returns:
         List of dates in YYYY-MM-DD format
     """
-    dates = []
     # Start from today to support realtime data during market hours
-    current_date = datetime.now()
+    today = np.datetime64(datetime.now().date(), "D")
 
-    for i in range(days_back + 5):  # Add buffer for weekends
-        date = current_date - timedelta(days=i)
-        # Skip weekends (roughly - doesn't account for holidays)
-        if date.weekday() < 5:
-            dates.append(date.strftime("%Y-%m-%d"))
+    # Scan back days_back + 5 calendar days (buffer for weekends) and keep the
+    # most recent weekdays (roughly - doesn't account for holidays)
+    lookback = days_back + 4 if days_back > 0 else 0
+    window = np.arange(today - lookback, today + 1)
+    weekdays = window[np.is_busday(window)][-max(days_back, 1):]
 
-        if len(dates) >= days_back:
-            break
+    return weekdays.astype(str).tolist()
 
-    return sorted(dates)
 
+def _weekday_window(center: date, days_window: int) -> List[Tuple[int, date, str]]:
+    """List the weekdays within ±days_window calendar days of a date.
+
+    Args:
+        center: Date the window is centred on
+        days_window: Number of calendar days before/after center
+
+    Returns:
+        List of (day_offset, date, YYYY-MM-DD string) tuples for weekdays only,
+        in ascending order
+    """
+    offsets = np.arange(-days_window, days_window + 1)
+    dates = np.datetime64(center, "D") + offsets
+    weekdays = np.is_busday(dates)
+    dates = dates[weekdays]
 
+    return list(zip(offsets[weekdays].tolist(), dates.tolist(), dates.astype(str).tolist()))
+
+
+# Offset to the nearest Friday, indexed by weekday() (Monday = 0)
+_NEAREST_FRIDAY_DELTA = tuple(timedelta(days=days) for days in (-3, 3, 2, 1, 0, -1, -2))
+
+
+@lru_cache(maxsize=4096)
 def find_nearest_expiration(target_date: date) -> date:
     """Find nearest standard option expiration (Friday).
 
@@ -758,24 +1117,18 @@ def find_nearest_expiration(target_date: date) -> date:
     Returns:
         Nearest Friday to target_date
     """
-    # Calculate days to next Friday (Friday = 4 in weekday())
-    days_until_friday = (4 - target_date.weekday()) % 7
-    if days_until_friday == 0:
-        # Already Friday
-        return target_date
+    # One table lookup instead of computing and comparing both neighbouring Fridays
+    return target_date + _NEAREST_FRIDAY_DELTA[target_date.weekday()]
 
-    next_friday = target_date + timedelta(days=days_until_friday)
 
-    # Calculate days since last Friday
-    days_since_friday = (target_date.weekday() - 4) % 7
-    if days_since_friday == 0:
-        days_since_friday = 7
-    prev_friday = target_date - timedelta(days=days_since_friday)
+@lru_cache(maxsize=1024)
+def _expiration_code(exp_date: date) -> str:
+    """Format an expiration as the YYMMDD code used in option symbols.
 
-    # Return closest Friday
-    if abs((next_friday - target_date).days) <= abs((prev_friday - target_date).days):
-        return next_friday
-    return prev_friday
+    Only a handful of distinct expirations occur per run, so the strftime
+    result is cached.
+    """
+    return exp_date.strftime("%y%m%d")
 
 
 def generate_smart_strikes(spot_price: float, max_strikes: int = 6) -> List[float]:
@@ -788,6 +1141,14 @@ def generate_smart_strikes(spot_price: float, max_strikes: int = 6) -> List[floa
     Returns:
         List of strike prices sorted by likelihood (nearest ATM first)
     """
+    # The same spot is probed for every DTE bucket and expiration, so the
+    # ladder is cached; callers get their own list copy
+    return list(_smart_strikes(spot_price, max_strikes))
+
+
+@lru_cache(maxsize=1024)
+def _smart_strikes(spot_price: float, max_strikes: int) -> Tuple[float, ...]:
+    """Cached body of generate_smart_strikes(), returning an immutable tuple."""
     # Determine strike interval based on stock price
     if spot_price < 50:
         interval = 2.5
@@ -801,28 +1162,147 @@ def generate_smart_strikes(spot_price: float, max_strikes: int = 6) -> List[floa
     # Round spot to nearest interval for ATM strike
     atm_strike = round(spot_price / interval) * interval
 
-    # Generate strikes centered on ATM
-    strikes = [atm_strike]
-    offset = 1
+    # Candidate offsets alternate above/below ATM (0, +1, -1, +2, -2, ...);
+    # max_strikes steps upward always yields enough positive strikes
+    steps = np.arange(1, max_strikes + 1)
+    offsets = np.empty(2 * max_strikes + 1, dtype=steps.dtype)
+    offsets[0] = 0
+    offsets[1::2] = steps
+    offsets[2::2] = -steps
+    candidates = atm_strike + offsets * interval
+
+    # ATM is always kept; other strikes must be positive. Take the first
+    # max_strikes in alternating order, then a stable sort by distance from
+    # spot (prioritize closest to ATM, upper strike first on ties)
+    keep = candidates > 0
+    keep[0] = True
+    strikes = candidates[keep][:max_strikes]
+    order = np.argsort(np.abs(strikes - spot_price), kind="stable")
+
+    return tuple(strikes[order].tolist())
+
 
-    while len(strikes) < max_strikes:
-        # Add strike above ATM
-        upper = atm_strike + (offset * interval)
-        if upper > 0:
-            strikes.append(upper)
+def _historic_iv_by_date(historic_records: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Index a contract's historic records by date, keeping the IV as a percentage.
 
-        # Add strike below ATM
-        if len(strikes) < max_strikes:
-            lower = atm_strike - (offset * interval)
-            if lower > 0:
-                strikes.append(lower)
+    Records without a usable implied_volatility are skipped; if a date appears
+    more than once, the first usable record wins.
 
-        offset += 1
+    Args:
+        historic_records: Historic daily records from get_option_historic()
+
+    Returns:
+        Dictionary mapping date (YYYY-MM-DD) to IV percentage
+    """
+    iv_by_date: Dict[str, float] = {}
+    for record in historic_records:
+        date_str = record.get('date')
+        iv_str = record.get('implied_volatility')
+        if not iv_str or date_str in iv_by_date:
+            continue
+        try:
+            iv_by_date[date_str] = float(iv_str) * 100
+        except (ValueError, TypeError):
+            continue
+    return iv_by_date
+
+
+def _historic_iv_by_contract(
+    historic_by_contract: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, Dict[str, float]]:
+    """Index every contract's historic records by date with _historic_iv_by_date().
+
+    Args:
+        historic_by_contract: Dictionary mapping contract_id to its historic records
+
+    Returns:
+        Dictionary mapping contract_id to its {date: IV percentage} index
+    """
+    return {
+        contract_id: _historic_iv_by_date(historic_records)
+        for contract_id, historic_records in historic_by_contract.items()
+    }
+
+
+class _SharedHistoricRequest:
+    """An in-flight historic-data request and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters", "_iv_by_date")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        self._iv_by_date: Optional[Dict[str, float]] = None
+
+    def iv_by_date(self) -> Dict[str, float]:
+        """Return the finished request's {date: IV%} index, building it on first use."""
+        if self._iv_by_date is None:
+            self._iv_by_date = _historic_iv_by_date(self.task.result())
+        return self._iv_by_date
 
-    # Sort by distance from spot (prioritize closest to ATM)
-    strikes.sort(key=lambda s: abs(s - spot_price))
 
-    return strikes[:max_strikes]
+async def _get_option_historic_once(
+    client,
+    contract_id: str,
+    historic_requests: Dict[str, _SharedHistoricRequest]
+) -> List[Dict[str, Any]]:
+    """Fetch a contract's historic records, sharing one request per contract.
+
+    The request keeps running while any caller still awaits it; once the last
+    caller is cancelled (e.g. a losing discovery probe), the request is
+    cancelled too so it stops holding a client slot.
+
+    Args:
+        client: UnusualWhalesClient instance
+        contract_id: Contract symbol to fetch
+        historic_requests: Requests made so far in this run, keyed by contract_id
+
+    Returns:
+        List of historic daily records (raises like client.get_option_historic)
+    """
+    request = historic_requests.get(contract_id)
+    if request is None or request.task.cancelled():
+        task = asyncio.create_task(client.get_option_historic(contract_id))
+        # Failures are re-raised to every awaiting caller; mark them retrieved so a
+        # request abandoned by all its callers doesn't log "exception was never retrieved"
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        request = _SharedHistoricRequest(task)
+        historic_requests[contract_id] = request
+
+    request.waiters += 1
+    try:
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(request.task)
+    finally:
+        request.waiters -= 1
+        if request.waiters == 0 and not request.task.done():
+            # Nobody is left waiting: drop the request instead of letting it run on
+            request.task.cancel()
+            if historic_requests.get(contract_id) is request:
+                del historic_requests[contract_id]
+
+
+async def _get_option_historic_iv_once(
+    client,
+    contract_id: str,
+    historic_requests: Dict[str, _SharedHistoricRequest]
+) -> Dict[str, float]:
+    """Fetch a contract's historic IV indexed by date, sharing one request per contract.
+
+    The date index is built once per request and reused by every caller.
+
+    Args:
+        client: UnusualWhalesClient instance
+        contract_id: Contract symbol to fetch
+        historic_requests: Requests made so far in this run, keyed by contract_id
+
+    Returns:
+        Dictionary mapping date (YYYY-MM-DD) to IV percentage (raises like
+        client.get_option_historic)
+    """
+    await _get_option_historic_once(client, contract_id, historic_requests)
+    # A finished request is never dropped from historic_requests
+    return historic_requests[contract_id].iv_by_date()
 
 
 async def try_fetch_contract_iv(
@@ -832,7 +1312,8 @@ async def try_fetch_contract_iv(
     ticker: str,
     exp_date: date,
     option_type: str,
-    strike: float
+    strike: float,
+    historic_requests: Optional[Dict[str, _SharedHistoricRequest]] = None
 ) -> Optional[tuple]:
     """Try to fetch IV for a single contract.
 
@@ -844,35 +1325,61 @@ async def try_fetch_contract_iv(
         exp_date: Expiration date
         option_type: "call" or "put"
         strike: Strike price
+        historic_requests: Optional shared historic-data requests keyed by contract_id,
+            so a contract is fetched and indexed at most once per run
 
     Returns:
         Tuple of (contract_id, parsed_data, iv_value) if successful, None otherwise
     """
-    try:
-        historic_records = await client.get_option_historic(contract_id)
+    if historic_requests is None:
+        historic_requests = {}
 
-        # Find IV for the specific analysis date
-        for record in historic_records:
-            if record.get('date') == analysis_date_str:
-                iv_str = record.get('implied_volatility')
-                if iv_str:
-                    try:
-                        iv_value = float(iv_str) * 100
-                        parsed = {
-                            'ticker': ticker,
-                            'expiration': exp_date.strftime("%Y-%m-%d"),
-                            'type': option_type,
-                            'strike': float(strike),
-                            'symbol': contract_id
-                        }
-                        return (contract_id, parsed, iv_value)
-                    except:
-                        pass
-    except:
+    try:
+        iv_by_date = await _get_option_historic_iv_once(client, contract_id, historic_requests)
+    except Exception:
         # Contract doesn't exist or has no data
-        pass
+        return None
 
-    return None
+    # Find IV for the specific analysis date
+    iv_value = iv_by_date.get(analysis_date_str)
+    if iv_value is None:
+        return None
+
+    parsed = {
+        'ticker': ticker,
+        'expiration': exp_date.isoformat(),
+        'type': option_type,
+        'strike': float(strike),
+        'symbol': contract_id
+    }
+    return (contract_id, parsed, iv_value)
+
+
+async def _first_result(tasks: List[asyncio.Task]) -> Optional[Any]:
+    """Return the first successful result from tasks, in priority order.
+
+    All tasks keep running concurrently while earlier ones are awaited. As soon
+    as a task yields a non-None result, the remaining tasks are cancelled.
+
+    Args:
+        tasks: Tasks ordered from most to least preferred
+
+    Returns:
+        First non-None result in task order, or None if every task failed
+    """
+    try:
+        for task in tasks:
+            try:
+                result = await task
+            except Exception:
+                continue
+            if result is not None:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
 
 async def brute_force_find_contract(
@@ -883,7 +1390,8 @@ async def brute_force_find_contract(
     analysis_date_str: str,
     option_types: List[str] = None,
     available_expirations: List[str] = None,
-    logger = None
+    logger = None,
+    historic_requests: Optional[Dict[str, _SharedHistoricRequest]] = None
 ) -> Optional[tuple]:
     """Try to find a contract using intelligent concurrent search.
 
@@ -896,12 +1404,16 @@ async def brute_force_find_contract(
         option_types: List of option type codes to try (e.g., ['C'], ['P'], or ['C', 'P'])
         available_expirations: Optional list of available expiration dates (from API)
         logger: Logger instance
+        historic_requests: Optional shared historic-data requests keyed by contract_id;
+            one dict is created per call if omitted and shared by every probe
 
     Returns:
         Tuple of (contract_id, parsed_data, iv_value) if found, None otherwise
     """
     if option_types is None:
         option_types = ['C']  # Default to calls only
+    if historic_requests is None:
+        historic_requests = {}
 
     # For past dates, don't use current available_expirations since they exclude expired contracts
     analysis_date = datetime.strptime(analysis_date_str, "%Y-%m-%d").date()
@@ -911,7 +1423,7 @@ async def brute_force_find_contract(
     # Use smart expiration selection and generate nearby alternatives
     if use_available_expirations:
         # Find closest available expiration
-        exp_dates = [datetime.strptime(exp, "%Y-%m-%d").date() for exp in available_expirations]
+        exp_dates = [date.fromisoformat(exp) for exp in available_expirations]
         primary_exp = min(exp_dates, key=lambda d: abs((d - target_exp_date).days))
         expirations_to_try = [primary_exp]
     else:
@@ -927,41 +1439,43 @@ async def brute_force_find_contract(
     # Generate smart strikes (only ~6 instead of 13+)
     strikes = generate_smart_strikes(spot_price, max_strikes=6)
 
-    # Try each expiration until we find one with data
+    # Contract symbol parts that don't depend on the expiration
+    strike_codes = [f"{int(strike * 1000):08d}" for strike in strikes]
+    opt_type_names = ["call" if opt_type_code == 'C' else "put" for opt_type_code in option_types]
+
+    # Build all candidate contracts for every expiration, in preference order
+    # (expiration first, then strike, then option type)
+    tasks = []
     for exp_date in expirations_to_try:
-        # Build all candidate contracts for this expiration
-        tasks = []
-        for strike in strikes:
-            for opt_type_code in option_types:
+        exp_str = _expiration_code(exp_date)
+        for strike, strike_code in zip(strikes, strike_codes):
+            for opt_type_code, opt_type_name in zip(option_types, opt_type_names):
                 # Construct contract symbol
-                exp_str = exp_date.strftime("%y%m%d")
-                strike_code = f"{int(strike * 1000):08d}"
                 contract_id = f"{ticker}{exp_str}{opt_type_code}{strike_code}"
 
-                # Determine option type name
-                opt_type_name = "call" if opt_type_code == 'C' else "put"
-
                 # Create task to fetch this contract
-                tasks.append(try_fetch_contract_iv(
+                tasks.append(asyncio.create_task(try_fetch_contract_iv(
                     client, contract_id, analysis_date_str,
-                    ticker, exp_date, opt_type_name, strike
-                ))
+                    ticker, exp_date, opt_type_name, strike,
+                    historic_requests
+                )))
 
-        # Fetch ALL candidates concurrently
-        if logger:
-            logger.info(f"  Trying {len(tasks)} contracts concurrently (exp={exp_date})")
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Return first successful result
-        for result in results:
-            if result is not None and not isinstance(result, Exception):
-                if logger:
-                    contract_id, parsed, iv_value = result
-                    logger.info(f"  Found contract: {contract_id} (strike=${parsed['strike']}, IV={iv_value:.1f}%)")
-                return result
+    # Fetch ALL candidates concurrently
+    if logger:
+        logger.info(
+            f"  Trying {len(tasks)} contracts concurrently "
+            f"(exp={', '.join(str(exp_date) for exp_date in expirations_to_try)})"
+        )
 
-    return None
+    # Return first successful result in preference order, cancelling the rest
+    result = await _first_result(tasks)
+    if result is not None and logger:
+        contract_id, parsed, iv_value = result
+        logger.info(
+            f"  Found contract: {contract_id} (exp={parsed['expiration']}, "
+            f"strike=${parsed['strike']}, IV={iv_value:.1f}%)"
+        )
+    return result
 
 
 async def discover_contracts_for_period(
@@ -971,7 +1485,8 @@ async def discover_contracts_for_period(
     spot_price: float,
     dte_buckets: List[int],
     option_types: List[str],
-    logger = None
+    logger = None,
+    historic_requests: Optional[Dict[str, _SharedHistoricRequest]] = None
 ) -> Dict[int, Optional[tuple]]:
     """Discover which contracts existed and have data for a specific time period.
 
@@ -983,10 +1498,15 @@ async def discover_contracts_for_period(
         dte_buckets: List of DTEs to discover (e.g., [14, 30, 60, 90, 180])
         option_types: List of option type codes (e.g., ['C'] or ['P'])
         logger: Logger instance
+        historic_requests: Optional shared historic-data requests keyed by contract_id,
+            so contracts probed here aren't fetched again later in the same run
 
     Returns:
         Dict mapping DTE -> (contract_id, parsed, expiration_date) or None
     """
+    if historic_requests is None:
+        historic_requests = {}
+
     if logger:
         logger.info(f"Discovering contracts for period starting {reference_date_str}")
 
@@ -996,26 +1516,26 @@ async def discover_contracts_for_period(
     # Helper function to test a single expiration/option_type combination
     async def test_expiration(target_dte: int, exp_date: date, opt_type_code: str, test_strike: float):
         """Test if a specific expiration has historic data for the reference date."""
-        exp_str = exp_date.strftime("%y%m%d")
+        exp_str = _expiration_code(exp_date)
         strike_code = f"{int(test_strike * 1000):08d}"
         contract_id = f"{ticker}{exp_str}{opt_type_code}{strike_code}"
 
         try:
-            historic_records = await client.get_option_historic(contract_id)
-
-            # Check if this contract has data for our reference date
-            has_data = any(record.get('date') == reference_date_str for record in historic_records)
+            iv_by_date = await _get_option_historic_iv_once(client, contract_id, historic_requests)
 
-            if has_data:
+            # Check if this contract has IV for our reference date
+            if reference_date_str in iv_by_date:
                 opt_type_name = "call" if opt_type_code == 'C' else "put"
                 return (target_dte, exp_date, opt_type_name)
             else:
                 return None
-        except:
+        except Exception as e:
+            if logger:
+                logger.debug(f"  Probe {contract_id} failed: {e}")
             return None
 
-    # Build all test tasks for concurrent execution
-    test_tasks = []
+    # Build all test tasks for concurrent execution, grouped by DTE in preference order
+    tasks_by_dte: Dict[int, List[asyncio.Task]] = {}
     for target_dte in dte_buckets:
         target_exp_date = reference_date + timedelta(days=target_dte)
 
@@ -1035,25 +1555,27 @@ async def discover_contracts_for_period(
         test_strike = strikes[0]  # Use first strike for testing
 
         # Create tasks for all (expiration × option_type) combinations
+        dte_tasks = tasks_by_dte.setdefault(target_dte, [])
         for exp_date in expirations_to_try:
             for opt_type_code in option_types:
-                test_tasks.append(test_expiration(target_dte, exp_date, opt_type_code, test_strike))
+                dte_tasks.append(asyncio.create_task(
+                    test_expiration(target_dte, exp_date, opt_type_code, test_strike)
+                ))
 
     # Execute all tests concurrently
     if logger:
-        logger.info(f"  Testing {len(test_tasks)} expiration combinations concurrently...")
+        test_count = sum(len(dte_tasks) for dte_tasks in tasks_by_dte.values())
+        logger.info(f"  Testing {test_count} expiration combinations concurrently...")
 
-    results = await asyncio.gather(*test_tasks)
+    # Each DTE takes its first successful match and cancels its remaining tests
+    results = await asyncio.gather(*(_first_result(dte_tasks) for dte_tasks in tasks_by_dte.values()))
 
-    # Process results - pick first successful match for each DTE
     for result in results:
         if result is not None:
             target_dte, exp_date, opt_type_name = result
-            # Only store if we haven't found one for this DTE yet
-            if target_dte not in discovered:
-                discovered[target_dte] = (exp_date, opt_type_name)
-                if logger:
-                    logger.info(f"  DTE {target_dte}: Using exp={exp_date} (verified historic data)")
+            discovered[target_dte] = (exp_date, opt_type_name)
+            if logger:
+                logger.info(f"  DTE {target_dte}: Using exp={exp_date} (verified historic data)")
 
     # Mark any DTEs we didn't find
     for target_dte in dte_buckets:
@@ -1147,15 +1669,16 @@ async def collect_earnings_iv_data(
             timestamp_str = candle.get("start_time") or candle.get("timestamp")
             if timestamp_str:
                 try:
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    date_str = dt.strftime("%Y-%m-%d")
+                    date_str = _timestamp_date(timestamp_str)
+                    if date_str is None:
+                        continue
                     ohlc_by_date[date_str] = {
                         'open': float(candle.get("open", 0)),
                         'high': float(candle.get("high", 0)),
                         'low': float(candle.get("low", 0)),
                         'close': float(candle.get("close", 0))
                     }
-                except:
+                except (ValueError, TypeError):
                     continue
 
     logger.info(f"Loaded OHLC data for {len(ohlc_by_date)} days")
@@ -1170,11 +1693,30 @@ async def collect_earnings_iv_data(
         try:
             parsed = client.parse_option_symbol(contract_id)
             parsed_contracts[contract_id] = parsed
-        except:
+        except Exception:
             continue
 
     logger.info(f"Parsed {len(parsed_contracts)} contracts")
 
+    # Group contracts by expiration (parsed once) so each (date, DTE) probe only
+    # visits expirations within tolerance; entries keep their position in
+    # parsed_contracts so candidate order is unchanged
+    entries_by_exp: Dict[date, List[Tuple[int, str, Dict[str, Any]]]] = {}
+    for position, (contract_id, parsed) in enumerate(parsed_contracts.items()):
+        try:
+            exp_date = date.fromisoformat(parsed['expiration'])
+        except (ValueError, TypeError):
+            # A malformed symbol only drops that contract, not the whole run
+            logger.debug(f"Skipping {contract_id}: unparseable expiration {parsed['expiration']!r}")
+            continue
+        entries_by_exp.setdefault(exp_date, []).append((position, contract_id, parsed))
+
+    # Sort each expiration's contracts by strike so the ATM neighbourhood is a bisect away
+    contracts_by_exp: Dict[date, Tuple[List[float], List[Tuple[int, str, Dict[str, Any]]]]] = {}
+    for exp_date, entries in entries_by_exp.items():
+        entries.sort(key=lambda entry: entry[2]['strike'])
+        contracts_by_exp[exp_date] = ([entry[2]['strike'] for entry in entries], entries)
+
     # Step 3.5: Fetch available expirations for smart matching
     try:
         available_expirations = await client.get_expiry_breakdown(ticker)
@@ -1193,138 +1735,168 @@ async def collect_earnings_iv_data(
     # Track metadata for each contract to help with processing later
     contract_metadata = {}  # contract_id -> list of (earnings_date_str, day_offset, analysis_date_str, target_dte, spot_price)
 
-    for earnings_date_str in past_earnings:
-        logger.info(f"Processing earnings date: {earnings_date_str}")
-        earnings_date = datetime.strptime(earnings_date_str, "%Y-%m-%d").date()
-
-        # Determine strategy based on earnings age
-        today = datetime.now().date()
-        earnings_age_days = (today - earnings_date).days
-        use_discovery = earnings_age_days > 60  # Use discovery for old earnings (> 60 days)
+    # Historic-data requests made during this run, so each contract is fetched at most once
+    historic_requests: Dict[str, _SharedHistoricRequest] = {}
 
-        discovered_contracts = None
+    # Weekday analysis dates (±days_window) per earnings date, shared with phase 3
+    analysis_days: Dict[str, List[Tuple[int, date, str]]] = {}
 
-        if use_discovery:
-            # OLD EARNINGS (> 60 days): Current chains won't have expired contracts
-            # Run discovery phase upfront
-            logger.info(f"Earnings is {earnings_age_days} days old, using DISCOVERY mode")
-
-            first_analysis_date = earnings_date - timedelta(days=days_window)
-            first_analysis_date_str = first_analysis_date.strftime("%Y-%m-%d")
-
-            # Get spot price for discovery
-            first_ohlc = ohlc_by_date.get(first_analysis_date_str)
-            if not first_ohlc:
-                logger.warning(f"No OHLC data for first analysis date {first_analysis_date_str}, skipping earnings period")
-                continue
-
-            discovery_spot = first_ohlc['close']
+    # Start discovery for every old earnings period (> 60 days) up front, so the
+    # later periods' probes are already in flight while earlier ones are collected
+    discovery_tasks: Dict[str, asyncio.Task] = {}
+    for earnings_date_str in past_earnings:
+        earnings_date = datetime.strptime(earnings_date_str, "%Y-%m-%d").date()
+        if (today - earnings_date).days <= 60:
+            continue
 
-            # Discover contracts for this entire earnings period
-            discovered_contracts = await discover_contracts_for_period(
+        first_analysis_date_str = (earnings_date - timedelta(days=days_window)).strftime("%Y-%m-%d")
+        first_ohlc = ohlc_by_date.get(first_analysis_date_str)
+        if first_ohlc:
+            discovery_tasks[earnings_date_str] = asyncio.create_task(discover_contracts_for_period(
                 client=client,
                 ticker=ticker,
                 reference_date_str=first_analysis_date_str,
-                spot_price=discovery_spot,
+                spot_price=first_ohlc['close'],
                 dte_buckets=dte_buckets,
                 option_types=option_types,
-                logger=logger
-            )
-        else:
-            # RECENT EARNINGS (< 60 days): Contracts still in current chains
-            # Will try current chains first in the date loop
-            logger.info(f"Earnings is {earnings_age_days} days old, using CURRENT CHAINS mode")
+                logger=logger,
+                historic_requests=historic_requests
+            ))
 
-        # Generate date range: ±days_window around earnings
-        for day_offset in range(-days_window, days_window + 1):
-            analysis_date = earnings_date + timedelta(days=day_offset)
-            analysis_date_str = analysis_date.strftime("%Y-%m-%d")
+    try:
+        for earnings_date_str in past_earnings:
+            logger.info(f"Processing earnings date: {earnings_date_str}")
+            earnings_date = datetime.strptime(earnings_date_str, "%Y-%m-%d").date()
+            analysis_days[earnings_date_str] = _weekday_window(earnings_date, days_window)
+
+            # Determine strategy based on earnings age
+            earnings_age_days = (today - earnings_date).days
+            use_discovery = earnings_age_days > 60  # Use discovery for old earnings (> 60 days)
+
+            if use_discovery:
+                # OLD EARNINGS (> 60 days): Current chains won't have expired contracts
+                # Discovery for the whole period was started before this loop
+                logger.info(f"Earnings is {earnings_age_days} days old, using DISCOVERY mode")
+
+                discovery_task = discovery_tasks.get(earnings_date_str)
+                if discovery_task is None:
+                    first_analysis_date_str = (earnings_date - timedelta(days=days_window)).strftime("%Y-%m-%d")
+                    logger.warning(f"No OHLC data for first analysis date {first_analysis_date_str}, skipping earnings period")
+                    continue
 
-            # Skip weekends
-            if analysis_date.weekday() >= 5:
-                continue
+                discovered_contracts = await discovery_task
 
-            # Get OHLC data for this date
-            ohlc = ohlc_by_date.get(analysis_date_str)
-            if not ohlc:
-                logger.warning(f"No OHLC data for {analysis_date_str}, skipping")
-                continue
+                # Contract id prefix (ticker + expiration + type) per discovered DTE bucket;
+                # only the strike code varies from day to day
+                discovered_prefixes = {}
+                for target_dte, discovered_info in discovered_contracts.items():
+                    if discovered_info:
+                        exp_date, opt_type_name = discovered_info
+                        opt_type_code = 'C' if opt_type_name == 'call' else 'P'
+                        discovered_prefixes[target_dte] = f"{ticker}{_expiration_code(exp_date)}{opt_type_code}"
+            else:
+                # RECENT EARNINGS (< 60 days): Contracts still in current chains
+                # Will try current chains first in the date loop
+                logger.info(f"Earnings is {earnings_age_days} days old, using CURRENT CHAINS mode")
+
+            # Weekdays in the ±days_window range around earnings
+            for day_offset, analysis_date, analysis_date_str in analysis_days[earnings_date_str]:
+                # Get OHLC data for this date
+                ohlc = ohlc_by_date.get(analysis_date_str)
+                if not ohlc:
+                    logger.warning(f"No OHLC data for {analysis_date_str}, skipping")
+                    continue
 
-            spot_price = ohlc['close']
+                spot_price = ohlc['close']
 
-            # For each DTE bucket, collect contract IDs
-            for target_dte in dte_buckets:
                 if use_discovery:
-                    # DISCOVERY MODE: Use pre-discovered contracts
-                    discovered_info = discovered_contracts.get(target_dte) if discovered_contracts else None
-                    if not discovered_info:
-                        continue
-
-                    exp_date, opt_type_name = discovered_info
+                    # Find ATM strikes for current spot price; they depend only on
+                    # the day, so every DTE bucket reuses them
+                    strike_codes = [
+                        (strike, f"{int(strike * 1000):08d}")
+                        for strike in generate_smart_strikes(spot_price, max_strikes=6)
+                    ]
+
+                # For each DTE bucket, collect contract IDs
+                for target_dte in dte_buckets:
+                    if use_discovery:
+                        # DISCOVERY MODE: Use pre-discovered contracts
+                        contract_prefix = discovered_prefixes.get(target_dte)
+                        if not contract_prefix:
+                            continue
 
-                    # Find ATM strike for current spot price
-                    strikes = generate_smart_strikes(spot_price, max_strikes=6)
+                        # Collect contract IDs for each strike
+                        for strike, strike_code in strike_codes:
+                            contract_id = contract_prefix + strike_code
+
+                            contracts_to_fetch.add(contract_id)
+
+                            # Store metadata
+                            if contract_id not in contract_metadata:
+                                contract_metadata[contract_id] = []
+                            contract_metadata[contract_id].append({
+                                'earnings_date_str': earnings_date_str,
+                                'day_offset': day_offset,
+                                'analysis_date_str': analysis_date_str,
+                                'target_dte': target_dte,
+                                'spot_price': spot_price,
+                                'strike': strike,
+                                'mode': 'discovery'
+                            })
 
-                    # Collect contract IDs for each strike
-                    for strike in strikes:
-                        opt_type_code = 'C' if opt_type_name == 'call' else 'P'
-                        exp_str = exp_date.strftime("%y%m%d")
-                        strike_code = f"{int(strike * 1000):08d}"
-                        contract_id = f"{ticker}{exp_str}{opt_type_code}{strike_code}"
-
-                        contracts_to_fetch.add(contract_id)
-
-                        # Store metadata
-                        if contract_id not in contract_metadata:
-                            contract_metadata[contract_id] = []
-                        contract_metadata[contract_id].append({
-                            'earnings_date_str': earnings_date_str,
-                            'day_offset': day_offset,
-                            'analysis_date_str': analysis_date_str,
-                            'target_dte': target_dte,
-                            'spot_price': spot_price,
-                            'strike': strike,
-                            'mode': 'discovery'
-                        })
-
-                else:
-                    # CURRENT CHAINS MODE: Collect contracts from current chains
-                    target_exp_date = analysis_date + timedelta(days=target_dte)
-
-                    # Find contracts with expiration close to target (±3 days tolerance)
-                    candidate_contracts = []
-                    for contract_id, parsed in parsed_contracts.items():
-                        exp_date = datetime.strptime(parsed['expiration'], "%Y-%m-%d").date()
-                        days_diff = abs((exp_date - target_exp_date).days)
-
-                        if days_diff <= 3:
-                            candidate_contracts.append((contract_id, parsed, days_diff))
-
-                    if candidate_contracts:
-                        # Sort by expiration match quality
-                        candidate_contracts.sort(key=lambda x: x[2])
-
-                        # Collect ATM strike candidates
-                        for contract_id, parsed, _ in candidate_contracts:
-                            strike = parsed['strike']
-                            strike_diff = abs(strike - spot_price)
-
-                            # Only consider strikes within ±10% of spot
-                            if strike_diff / spot_price <= 0.10:
-                                contracts_to_fetch.add(contract_id)
-
-                                # Store metadata
-                                if contract_id not in contract_metadata:
-                                    contract_metadata[contract_id] = []
-                                contract_metadata[contract_id].append({
-                                    'earnings_date_str': earnings_date_str,
-                                    'day_offset': day_offset,
-                                    'analysis_date_str': analysis_date_str,
-                                    'target_dte': target_dte,
-                                    'spot_price': spot_price,
-                                    'strike': strike,
-                                    'mode': 'current_chains'
-                                })
+                    else:
+                        # CURRENT CHAINS MODE: Collect contracts from current chains
+                        target_exp_date = analysis_date + timedelta(days=target_dte)
+
+                        # Strike window around spot, slightly widened so the bisect never
+                        # drops a boundary strike; the exact ±10% check below decides
+                        strike_window = spot_price * 0.10 * (1 + 1e-9)
+                        strike_low = spot_price - strike_window
+                        strike_high = spot_price + strike_window
+
+                        # Find contracts with expiration close to target (±3 days tolerance),
+                        # ordered by expiration match quality
+                        candidate_contracts = []
+                        for days_diff in range(4):
+                            nearby = []
+                            for exp_date in {target_exp_date - timedelta(days=days_diff), target_exp_date + timedelta(days=days_diff)}:
+                                bucket = contracts_by_exp.get(exp_date)
+                                if bucket:
+                                    bucket_strikes, bucket_entries = bucket
+                                    lo = bisect.bisect_left(bucket_strikes, strike_low)
+                                    hi = bisect.bisect_right(bucket_strikes, strike_high)
+                                    nearby.extend(bucket_entries[lo:hi])
+                            nearby.sort(key=lambda entry: entry[0])
+                            for _, contract_id, parsed in nearby:
+                                candidate_contracts.append((contract_id, parsed, days_diff))
+
+                        if candidate_contracts:
+                            # Collect ATM strike candidates
+                            for contract_id, parsed, _ in candidate_contracts:
+                                strike = parsed['strike']
+                                strike_diff = abs(strike - spot_price)
+
+                                # Only consider strikes within ±10% of spot
+                                if strike_diff / spot_price <= 0.10:
+                                    contracts_to_fetch.add(contract_id)
+
+                                    # Store metadata
+                                    if contract_id not in contract_metadata:
+                                        contract_metadata[contract_id] = []
+                                    contract_metadata[contract_id].append({
+                                        'earnings_date_str': earnings_date_str,
+                                        'day_offset': day_offset,
+                                        'analysis_date_str': analysis_date_str,
+                                        'target_dte': target_dte,
+                                        'spot_price': spot_price,
+                                        'strike': strike,
+                                        'mode': 'current_chains'
+                                    })
+    finally:
+        # Don't leave discovery running if collection fails or is cancelled
+        for discovery_task in discovery_tasks.values():
+            if not discovery_task.done():
+                discovery_task.cancel()
 
     logger.info(f"PHASE 1 complete: Collected {len(contracts_to_fetch)} unique contracts to fetch")
 
@@ -1332,26 +1904,43 @@ async def collect_earnings_iv_data(
     logger.info("PHASE 2: Fetching all contract historic data concurrently...")
 
     async def fetch_contract(contract_id: str):
-        """Helper to fetch a single contract's historic data."""
+        """Helper to fetch a single contract's historic IV, indexed by date."""
         try:
-            historic_records = await client.get_option_historic(contract_id)
-            return (contract_id, historic_records)
+            iv_by_date = await _get_option_historic_iv_once(client, contract_id, historic_requests)
+            return (contract_id, iv_by_date)
         except Exception as e:
             logger.debug(f"Failed to fetch {contract_id}: {e}")
             return (contract_id, None)
 
-    # Fetch all contracts concurrently
-    fetch_tasks = [fetch_contract(cid) for cid in contracts_to_fetch]
-    fetch_results = await asyncio.gather(*fetch_tasks)
-
-    # Build cache: contract_id -> historic_records
-    historic_cache = {}
-    for contract_id, records in fetch_results:
-        if records is not None:
-            historic_cache[contract_id] = records
+    # Contracts already requested during discovery reuse those requests; the
+    # rest go out through the client's batch call
+    shared_ids = [cid for cid in contracts_to_fetch if cid in historic_requests]
+    batch_ids = [cid for cid in contracts_to_fetch if cid not in historic_requests]
+
+    shared_results, batch_results = await asyncio.gather(
+        asyncio.gather(*(fetch_contract(cid) for cid in shared_ids)),
+        client.get_option_historic_batch(batch_ids)
+    )
+
+    # Build cache: contract_id -> {date: IV%}, indexed once per contract. Parsing
+    # the batch's series is the bulk of the CPU work, so it runs in a worker
+    # thread to keep the bot's event loop responsive; shared requests already
+    # carry their index from discovery
+    historic_cache = await asyncio.to_thread(_historic_iv_by_contract, batch_results)
+    for contract_id, iv_by_date in shared_results:
+        if iv_by_date is not None:
+            historic_cache[contract_id] = iv_by_date
 
     logger.info(f"PHASE 2 complete: Successfully fetched {len(historic_cache)}/{len(contracts_to_fetch)} contracts")
 
+    # Index contract metadata by (earnings_date_str, day_offset, target_dte),
+    # keeping contract_metadata's order so the same contract wins as before
+    contracts_by_slot: Dict[Tuple[str, int, int], List[Tuple[str, Dict[str, Any]]]] = {}
+    for contract_id, metadata_list in contract_metadata.items():
+        for metadata in metadata_list:
+            slot = (metadata['earnings_date_str'], metadata['day_offset'], metadata['target_dte'])
+            contracts_by_slot.setdefault(slot, []).append((contract_id, metadata))
+
     # Step 6: PHASE 3 - Process cached data to build results
     logger.info("PHASE 3: Processing cached data to build results...")
     results = {
@@ -1361,25 +1950,15 @@ async def collect_earnings_iv_data(
 
     # Process each earnings period
     for earnings_date_str in past_earnings:
-        earnings_date = datetime.strptime(earnings_date_str, "%Y-%m-%d").date()
         earnings_data_points = {}
 
-        # Generate date range: ±days_window around earnings
-        for day_offset in range(-days_window, days_window + 1):
-            analysis_date = earnings_date + timedelta(days=day_offset)
-            analysis_date_str = analysis_date.strftime("%Y-%m-%d")
-
-            # Skip weekends
-            if analysis_date.weekday() >= 5:
-                continue
-
+        # Weekdays in the ±days_window range around earnings
+        for day_offset, _, analysis_date_str in analysis_days[earnings_date_str]:
             # Get OHLC data for this date
             ohlc = ohlc_by_date.get(analysis_date_str)
             if not ohlc:
                 continue
 
-            spot_price = ohlc['close']
-
             # For each DTE bucket, find IV data from cached results
             dte_ivs = {}
 
@@ -1387,37 +1966,18 @@ async def collect_earnings_iv_data(
                 iv_value = None
 
                 # Find contracts that match this (earnings_date, day_offset, target_dte)
-                # We'll check all contracts in our metadata
-                for contract_id, metadata_list in contract_metadata.items():
-                    for metadata in metadata_list:
-                        if (metadata['earnings_date_str'] == earnings_date_str and
-                            metadata['day_offset'] == day_offset and
-                            metadata['target_dte'] == target_dte):
-
-                            # Get historic records from cache
-                            historic_records = historic_cache.get(contract_id)
-                            if not historic_records:
-                                continue
-
-                            # Find IV for this specific analysis date
-                            for record in historic_records:
-                                if record.get('date') == analysis_date_str:
-                                    iv_str = record.get('implied_volatility')
-                                    if iv_str:
-                                        try:
-                                            iv_value = float(iv_str) * 100
-                                            dte_ivs[target_dte] = iv_value
-                                            strike = metadata['strike']
-                                            mode = metadata['mode']
-                                            logger.debug(f"  {analysis_date_str} DTE{target_dte}: {iv_value:.1f}% ({mode}, strike=${strike})")
-                                            break
-                                        except:
-                                            pass
-
-                            if iv_value is not None:
-                                break
+                for contract_id, metadata in contracts_by_slot.get((earnings_date_str, day_offset, target_dte), ()):
+                    # Get IV for this specific analysis date from cache
+                    iv_by_date = historic_cache.get(contract_id)
+                    if not iv_by_date:
+                        continue
 
+                    iv_value = iv_by_date.get(analysis_date_str)
                     if iv_value is not None:
+                        dte_ivs[target_dte] = iv_value
+                        strike = metadata['strike']
+                        mode = metadata['mode']
+                        logger.debug(f"  {analysis_date_str} DTE{target_dte}: {iv_value:.1f}% ({mode}, strike=${strike})")
                         break
 
                 if iv_value is None:
@@ -1427,8 +1987,7 @@ async def collect_earnings_iv_data(
             if dte_ivs or ohlc:
                 earnings_data_points[day_offset] = {
                     'ivs': dte_ivs,
-                    'ohlc': ohlc,
-                    'spot_price': spot_price
+                    'ohlc': ohlc  # Spot price is ohlc['close']
                 }
 
         results['data'][earnings_date_str] = earnings_data_points